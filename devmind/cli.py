@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import importlib
+import functools
 from pathlib import Path
 from typing import Any, Callable, Protocol, TypeVar, cast
 
@@ -13,7 +13,13 @@ from .reporting import generate_summary
 from .rollback import rollback_from_journal
 from .rules_engine import apply_rules
 from .scanner import scan
-from .utils import get_console, load_documents, load_json, save_json
+from .utils import (
+    get_console,
+    load_documents,
+    load_json,
+    load_plan_index,
+    save_json,
+)
 
 TFunc = TypeVar("TFunc", bound=Callable[..., Any])
 
@@ -83,20 +89,18 @@ def _load_typer_module() -> TyperModuleProtocol:
     """Typer 모듈 로드/Load Typer module."""
 
     try:
-        module = importlib.import_module("typer")
-        return cast(TyperModuleProtocol, module)
-    except Exception:  # pragma: no cover - optional dependency
+        import typer
+    except ImportError:  # pragma: no cover - optional dependency
         return _TyperFallbackModule()
+    return cast(TyperModuleProtocol, typer)
 
 
 typer_module = _load_typer_module()
 Option = typer_module.Option
 Argument = typer_module.Argument
-app = typer_module.Typer(help="프로젝트 자동 정리 CLI/Project organization CLI")
 console = get_console()
 
 
-@app.command()
 def scan_cmd(
     paths: list[str] = Option(..., help="스캔 경로 목록/Paths to scan"),
     max_size: int = Option(500 * 1024 * 1024, help="최대 파일 크기/Max file size"),
@@ -112,7 +116,6 @@ def scan_cmd(
     scan(config)
 
 
-@app.command()
 def rules(
     config_path: Path = Option(..., help="규칙 설정 경로/Path to rules config"),
     emit: Path = Option(Path(".cache/scores.json"), help="출력 경로/Output path"),
@@ -122,7 +125,6 @@ def rules(
     apply_rules(Path(".cache/devmind_scan.db"), config_path, emit)
 
 
-@app.command()
 def cluster(
     model: str = Option("heuristic", help="모델 이름/Model name"),
     budget: str = Option("$0", help="예산/Budget"),
@@ -164,7 +166,6 @@ def cluster(
     )
 
 
-@app.command()
 def organize(
     projects: Path = Option(
         Path(".cache/projects.json"), help="프로젝트 파일/Projects file"
@@ -200,16 +201,12 @@ def organize(
     cluster_result = ClusterResult(
         projects=[ClusterProject.from_dict(payload) for payload in cluster_payloads]
     )
-    scan_documents = load_documents(Path(".cache/devmind_scan.db"))
-    scan_index = {
-        str(item.get("doc_id", "")): item for item in scan_documents if "doc_id" in item
-    }
+    scan_index = load_plan_index(Path(".cache/devmind_scan.db"))
     score_map = load_scores(Path(".cache/scores.json"))
     plans = build_plans(cluster_result, schema, score_map, scan_index)
     execute_plans(plans, journal, schema.mode)
 
 
-@app.command()
 def report(
     clusters: Path = Option(
         Path(".cache/projects.json"), help="클러스터 파일/Cluster file"
@@ -239,17 +236,28 @@ def report(
     generate_summary(cluster_result, journal, html_path, json_path, csv_path)
 
 
-@app.command()
 def rollback(journal: Path = Argument(..., help="저널 경로/Journal path")) -> None:
     """저널 롤백 실행/Execute journal rollback."""
 
     rollback_from_journal(journal)
 
 
+@functools.cache
+def get_app() -> TyperAppProtocol:
+    """Typer 앱 지연 생성/Lazily build Typer app."""
+
+    application = typer_module.Typer(
+        help="프로젝트 자동 정리 CLI/Project organization CLI"
+    )
+    for command in (scan_cmd, rules, cluster, organize, report, rollback):
+        application.command()(command)
+    return application
+
+
 def main() -> None:
     """엔트리 포인트/Entry point."""
 
-    app()
+    get_app()()
 
 
 if __name__ == "__main__":
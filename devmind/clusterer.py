@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import re
+import string
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +13,12 @@ from typing import Dict, Iterable, List
 from .config import ClusterProject, ClusterResult
 from .utils import load_json
 
+_LABEL_ALLOWED = frozenset(string.ascii_letters + string.digits + "_-")
+_LABEL_TRANSLATION = str.maketrans(
+    {chr(code): "_" for code in range(128) if chr(code) not in _LABEL_ALLOWED}
+)
+_LABEL_INVALID_PATTERN = re.compile(r"[^\w-]")
+
 
 @dataclass(slots=True)
 class ClusterInput:
@@ -25,19 +34,22 @@ class ClusterInput:
 def _normalize_label(label: str) -> str:
     """라벨 정규화/Normalize label."""
 
-    normalized = "".join(
-        ch if ch.isalnum() or ch in {"_", "-"} else "_" for ch in label
-    )
-    normalized = normalized.strip("_ ")
-    return normalized.lower()
+    if label.isascii():
+        normalized = label.translate(_LABEL_TRANSLATION)
+    else:
+        normalized = _LABEL_INVALID_PATTERN.sub("_", label)
+    return normalized.strip("_ ").lower()
 
 
-def infer_project_label(path: Path, hints: Iterable[str]) -> str:
-    """프로젝트 라벨 추론/Infer project label."""
+def _infer_label_from_lowered(path: Path, hints_lower: Iterable[str]) -> str:
+    """소문자 힌트로 라벨 추론/Infer label from lowercased hints."""
 
-    segments = [segment.lower() for segment in path.parts if len(segment) > 2]
-    for hint in hints:
-        if hint.lower() in segments:
+    segments = [
+        segment for segment in os.fspath(path).lower().split(os.sep) if len(segment) > 2
+    ]
+    segment_set = set(segments)
+    for hint in hints_lower:
+        if hint in segment_set:
             return _normalize_label(hint)
     if len(segments) >= 2:
         return _normalize_label("_".join(segments[-2:]))
@@ -46,6 +58,12 @@ def infer_project_label(path: Path, hints: Iterable[str]) -> str:
     return "general_project"
 
 
+def infer_project_label(path: Path, hints: Iterable[str]) -> str:
+    """프로젝트 라벨 추론/Infer project label."""
+
+    return _infer_label_from_lowered(path, [hint.lower() for hint in hints])
+
+
 def cluster_documents(
     documents: List[ClusterInput],
     hints: Iterable[str],
@@ -53,17 +71,27 @@ def cluster_documents(
 ) -> ClusterResult:
     """문서들을 프로젝트로 군집화/Cluster documents into projects."""
 
+    hints_lower = tuple(hint.lower() for hint in hints)
     clusters: Dict[str, List[ClusterInput]] = defaultdict(list)
+    label_cache: Dict[Path, str] = {}
     for document in documents:
-        label = infer_project_label(document.path.parent, hints)
+        parent = document.path.parent
+        label = label_cache.get(parent)
+        if label is None:
+            label = _infer_label_from_lowered(parent, hints_lower)
+            label_cache[parent] = label
         clusters[label].append(document)
     projects: List[ClusterProject] = []
-    for index, (label, docs) in enumerate(sorted(clusters.items())):
+    score_get = score_map.get
+    for index, label in enumerate(sorted(clusters)):
+        docs = clusters[label]
         project_id = f"project_{index+1:03d}"
-        doc_ids = [doc.doc_id for doc in docs]
-        role_bucket_map = {
-            doc.doc_id: score_map.get(doc.doc_id, doc.bucket) for doc in docs
-        }
+        doc_ids: List[str] = []
+        role_bucket_map: Dict[str, str] = {}
+        for doc in docs:
+            doc_id = doc.doc_id
+            doc_ids.append(doc_id)
+            role_bucket_map[doc_id] = score_get(doc_id, doc.bucket)
         confidence = round(min(1.0, 0.6 + len(docs) * 0.05), 2)
         reasons = [f"grouped_by:{label}", f"docs:{len(docs)}"]
         projects.append(
@@ -4,7 +4,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+from .utils import KeywordMatcher
+
+
+def _as_str(value: Any) -> str:
+    """문자열 변환(이미 문자열이면 그대로)/Convert to str unless already str."""
+
+    return value if type(value) is str else str(value)
+
+
+def _as_str_list(values: Iterable[Any]) -> List[str]:
+    """문자열 목록 변환/Convert values to a list of str."""
+
+    if type(values) is list and all(type(value) is str for value in values):
+        return values
+    return [str(value) for value in values]
 
 
 @dataclass(slots=True)
@@ -23,12 +39,13 @@ class BucketRule:
     """버킷 규칙 정의/Define bucket rule."""
 
     name: str
-    exts: List[str] = field(default_factory=list)
+    exts: FrozenSet[str] = field(default_factory=frozenset)
     name_keywords: List[str] = field(default_factory=list)
     dir_keywords: List[str] = field(default_factory=list)
     code_hints: List[str] = field(default_factory=list)
     imports: List[str] = field(default_factory=list)
     title_keywords: List[str] = field(default_factory=list)
+    matchers: Dict[str, KeywordMatcher] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -79,11 +96,11 @@ class ClusterProject:
     def from_dict(cls, payload: Dict[str, Any]) -> "ClusterProject":
         """사전에서 프로젝트 생성/Create project from dict."""
 
-        doc_ids = [str(value) for value in payload.get("doc_ids", [])]
+        doc_ids = _as_str_list(payload.get("doc_ids", []))
         role_map_raw = payload.get("role_bucket_map", {})
         role_map = (
             {
-                str(key): str(value)
+                key: _as_str(value)
                 for key, value in role_map_raw.items()
                 if isinstance(key, str)
             }
@@ -91,10 +108,10 @@ class ClusterProject:
             else {}
         )
         reasons_raw = payload.get("reasons", [])
-        reasons = [str(reason) for reason in reasons_raw]
+        reasons = _as_str_list(reasons_raw)
         return cls(
-            project_id=str(payload.get("project_id", "")),
-            project_label=str(payload.get("project_label", "")),
+            project_id=_as_str(payload.get("project_id", "")),
+            project_label=_as_str(payload.get("project_label", "")),
             doc_ids=doc_ids,
             role_bucket_map=role_map,
             confidence=float(payload.get("confidence", 0.0)),
@@ -134,27 +151,61 @@ class FileDocument:
         """사전에서 파일 문서 생성/Create file document from dict."""
 
         return cls(
-            doc_id=str(payload.get("doc_id", "")),
-            path=Path(str(payload.get("path", ""))),
-            name=str(payload.get("name", "")),
-            ext=str(payload.get("ext", "")),
+            doc_id=_as_str(payload.get("doc_id", "")),
+            path=Path(_as_str(payload.get("path", ""))),
+            name=_as_str(payload.get("name", "")),
+            ext=_as_str(payload.get("ext", "")),
             size=int(payload.get("size", 0)),
             mtime=float(payload.get("mtime", 0.0)),
-            blake3=str(payload.get("blake3", "")),
-            mimetype=str(payload.get("mimetype", "application/octet-stream")),
-            dir_hint=str(payload.get("dir_hint", "")),
-            imports_first=[str(value) for value in payload.get("imports_first", [])],
+            blake3=_as_str(payload.get("blake3", "")),
+            mimetype=_as_str(payload.get("mimetype", "application/octet-stream")),
+            dir_hint=_as_str(payload.get("dir_hint", "")),
+            imports_first=_as_str_list(payload.get("imports_first", [])),
             top_comment=(
-                str(payload["top_comment"])
+                _as_str(payload["top_comment"])
                 if payload.get("top_comment") is not None
                 else None
             ),
-            md_headings=[str(value) for value in payload.get("md_headings", [])],
-            json_root_keys=[str(value) for value in payload.get("json_root_keys", [])],
-            csv_header=[str(value) for value in payload.get("csv_header", [])],
-            sample_text=str(payload.get("sample_text", "")),
+            md_headings=_as_str_list(payload.get("md_headings", [])),
+            json_root_keys=_as_str_list(payload.get("json_root_keys", [])),
+            csv_header=_as_str_list(payload.get("csv_header", [])),
+            sample_text=_as_str(payload.get("sample_text", "")),
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 사전 변환/Convert to a serializable dict."""
+
+        return {
+            "doc_id": self.doc_id,
+            "path": str(self.path),
+            "name": self.name,
+            "ext": self.ext,
+            "size": self.size,
+            "mtime": self.mtime,
+            "blake3": self.blake3,
+            "mimetype": self.mimetype,
+            "dir_hint": self.dir_hint,
+            "imports_first": self.imports_first,
+            "top_comment": self.top_comment,
+            "md_headings": self.md_headings,
+            "json_root_keys": self.json_root_keys,
+            "csv_header": self.csv_header,
+            "sample_text": self.sample_text,
+        }
+
+
+@dataclass(slots=True)
+class RuleDocument:
+    """규칙 스코어링용 경량 문서/Lightweight document for rule scoring."""
+
+    doc_id: str
+    ext: str
+    name: str
+    dir_hint: str
+    sample_text: str
+    imports_first: List[str]
+    md_headings: List[str]
+
 
 @dataclass(slots=True)
 class BucketScore:
@@ -174,6 +225,6 @@ class OrganizePlan:
     project_id: str
     project_label: str
     bucket: str
-    source_path: Path
+    source_path: str
     target_path: Path
     hash_suffix: str
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import errno
+import functools
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from .config import ClusterResult, OrganizePlan, SchemaConfig
 from .utils import (
@@ -18,18 +23,20 @@ from .utils import (
 console = get_console()
 
 
-BUCKET_DIRECTORY_MAP: Dict[str, str] = {
-    "src": "src/core",
-    "scripts": "scripts",
-    "tests": "tests/unit",
-    "docs": "docs",
-    "reports": "reports",
-    "configs": "configs",
-    "data": "data/raw",
-    "notebooks": "notebooks",
-    "archive": "archive",
-    "tmp": "tmp",
-}
+BUCKET_DIRECTORY_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "src": "src/core",
+        "scripts": "scripts",
+        "tests": "tests/unit",
+        "docs": "docs",
+        "reports": "reports",
+        "configs": "configs",
+        "data": "data/raw",
+        "notebooks": "notebooks",
+        "archive": "archive",
+        "tmp": "tmp",
+    }
+)
 
 
 def load_schema(path: Path) -> SchemaConfig:
@@ -54,31 +61,57 @@ def ensure_schema_structure(target_root: Path, structure: Iterable[str]) -> None
         ensure_directory(target_root / relative)
 
 
+def _ensure_directory_once(path: Path, ensured_dirs: set[Path]) -> None:
+    """디렉터리 생성 1회 보장/Ensure directory exists once per run."""
+
+    if path in ensured_dirs:
+        return
+    ensure_directory(path)
+    ensured_dirs.add(path)
+
+
+def _directory_names(base: Path, directory_names: Dict[Path, set[str]]) -> set[str]:
+    """디렉터리 파일명 캐시 조회/Look up cached directory entry names."""
+
+    names = directory_names.get(base)
+    if names is None:
+        ensure_directory(base)
+        with os.scandir(base) as entries:
+            names = {os.path.normcase(entry.name) for entry in entries}
+        directory_names[base] = names
+    return names
+
+
+@functools.lru_cache(maxsize=4096)
+def _bucket_directory(project_root: str, bucket: str) -> Path:
+    """버킷 대상 디렉터리 캐시/Cached bucket target directory."""
+
+    return Path(os.path.join(project_root, BUCKET_DIRECTORY_MAP.get(bucket, "archive")))
+
+
 def resolve_target_path(
     project_root: Path,
     bucket: str,
     source_name: str,
     digest: str,
-    used_targets: set[Path],
+    directory_names: Dict[Path, set[str]],
 ) -> Tuple[Path, str]:
     """대상 경로 결정/Resolve target path."""
 
-    relative = BUCKET_DIRECTORY_MAP.get(bucket, "archive")
-    base = project_root / relative
-    ensure_directory(base)
-    stem = Path(source_name).stem
-    suffix = Path(source_name).suffix
+    base = _bucket_directory(os.fspath(project_root), bucket)
+    names = _directory_names(base, directory_names)
+    stem, suffix = os.path.splitext(source_name)
     hash_suffix = digest[:7]
-    candidate = base / source_name
+    candidate_name = source_name
     attempt = 0
-    while candidate in used_targets or candidate.exists():
+    while os.path.normcase(candidate_name) in names:
         name_suffix = (
             f"__{hash_suffix}" if attempt == 0 else f"__{hash_suffix}_{attempt}"
         )
-        candidate = base / f"{stem}{name_suffix}{suffix}"
+        candidate_name = f"{stem}{name_suffix}{suffix}"
         attempt += 1
-    used_targets.add(candidate)
-    return candidate, hash_suffix
+    names.add(os.path.normcase(candidate_name))
+    return base / candidate_name, hash_suffix
 
 
 def build_plans(
@@ -90,71 +123,105 @@ def build_plans(
     """조직화 계획 생성/Build organization plan."""
 
     plans: List[OrganizePlan] = []
+    plans_append = plans.append
+    ensured_dirs: set[Path] = set()
+    directory_names: Dict[Path, set[str]] = {}
+    scan_index_get = scan_index.get
+    score_map_get = score_map.get
+    basename = os.path.basename
     for project in cluster.projects:
-        project_root = schema.target_root / project.project_label
-        ensure_schema_structure(project_root, schema.structure)
-        used_targets: set[Path] = set()
+        project_id = project.project_id
+        project_label = project.project_label
+        project_root = schema.target_root / project_label
+        for relative in schema.structure:
+            _ensure_directory_once(project_root / relative, ensured_dirs)
+        role_get = project.role_bucket_map.get
         for doc_id in project.doc_ids:
-            metadata = scan_index.get(doc_id)
+            metadata = scan_index_get(doc_id)
             if not metadata:
                 continue
-            source_path = Path(str(metadata.get("path", "")))
+            source_path = str(metadata.get("path", ""))
             digest = str(metadata.get("blake3", ""))
-            bucket = project.role_bucket_map.get(
-                doc_id,
-                score_map.get(doc_id, "archive"),
-            )
+            bucket = role_get(doc_id, score_map_get(doc_id, "archive"))
             target_path, hash_suffix = resolve_target_path(
-                project_root=project_root,
-                bucket=bucket,
-                source_name=source_path.name,
-                digest=digest,
-                used_targets=used_targets,
+                project_root, bucket, basename(source_path), digest, directory_names
             )
-            plans.append(
+            plans_append(
                 OrganizePlan(
-                    doc_id=doc_id,
-                    project_id=project.project_id,
-                    project_label=project.project_label,
-                    bucket=bucket,
-                    source_path=source_path,
-                    target_path=target_path,
-                    hash_suffix=hash_suffix,
+                    doc_id,
+                    project_id,
+                    project_label,
+                    bucket,
+                    source_path,
+                    target_path,
+                    hash_suffix,
                 )
             )
     return plans
 
 
+def _move_file(source: str, target: Path) -> None:
+    """파일 이동(동일 볼륨 rename 우선)/Move file preferring same-volume rename."""
+
+    try:
+        os.replace(source, target)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        shutil.move(source, str(target))
+
+
+def _execute_plan(
+    plan: OrganizePlan, mode: str, ensured_dirs: set[Path]
+) -> Dict[str, Any]:
+    """단일 계획 실행/Execute a single plan."""
+
+    if not os.path.exists(plan.source_path):
+        status = "missing"
+    else:
+        _ensure_directory_once(plan.target_path.parent, ensured_dirs)
+        if mode == "move":
+            _move_file(plan.source_path, plan.target_path)
+        else:
+            shutil.copy2(plan.source_path, plan.target_path)
+        status = "moved" if mode == "move" else "copied"
+    return {
+        "original_path": plan.source_path,
+        "target_path": str(plan.target_path),
+        "doc_id": plan.doc_id,
+        "project_id": plan.project_id,
+        "project_label": plan.project_label,
+        "bucket": plan.bucket,
+        "hash_suffix": plan.hash_suffix,
+        "timestamp": now_ts(),
+        "status": status,
+    }
+
+
 def execute_plans(plans: Iterable[OrganizePlan], journal_path: Path, mode: str) -> None:
     """이동 계획 실행/Execute move plans."""
 
-    entries = []
-    for plan in plans:
-        if not plan.source_path.exists():
-            status = "missing"
-            target_path = plan.target_path
-        else:
-            ensure_directory(plan.target_path.parent)
-            if mode == "move":
-                shutil.move(str(plan.source_path), str(plan.target_path))
-            else:
-                shutil.copy2(str(plan.source_path), str(plan.target_path))
-            target_path = plan.target_path
-            status = "moved" if mode == "move" else "copied"
-        entries.append(
-            {
-                "original_path": str(plan.source_path),
-                "target_path": str(target_path),
-                "doc_id": plan.doc_id,
-                "project_id": plan.project_id,
-                "project_label": plan.project_label,
-                "bucket": plan.bucket,
-                "hash_suffix": plan.hash_suffix,
-                "timestamp": now_ts(),
-                "status": status,
-            }
-        )
-    append_jsonl(journal_path, entries)
+    ensured_dirs: set[Path] = set()
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    entries: List[Dict[str, Any]] = []
+    first_error: Optional[Exception] = None
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_execute_plan, plan, mode, ensured_dirs)
+                for plan in plans
+            ]
+            for future in futures:
+                try:
+                    entries.append(future.result())
+                except Exception as error:
+                    if first_error is None:
+                        first_error = error
+    finally:
+        # 실패 시에도 완료분 기록(롤백 가능)/Journal completed moves even on failure.
+        append_jsonl(journal_path, entries)
+    if first_error is not None:
+        raise first_error
     message = (
         "[green]총 {count}개 파일 이동 기록/Recorded {count} moves.[/green]"
     ).format(count=len(entries))
@@ -5,7 +5,7 @@ from __future__ import annotations
 import shutil
 from pathlib import Path
 
-from .utils import ensure_directory, get_console, read_jsonl
+from .utils import ensure_directory, get_console, read_jsonl_reversed
 
 console = get_console()
 
@@ -13,11 +13,9 @@ console = get_console()
 def rollback_from_journal(journal_path: Path) -> None:
     """저널 기반 롤백 수행/Roll back using journal."""
 
-    entries = read_jsonl(journal_path)
-    if not entries:
-        console.print("[yellow]저널 데이터가 없습니다/No journal data found.[/yellow]")
-        return
-    for entry in reversed(entries):
+    count = 0
+    for entry in read_jsonl_reversed(journal_path):
+        count += 1
         original_raw = entry.get("original_path")
         target_raw = entry.get("target_path")
         if not isinstance(original_raw, str) or not isinstance(target_raw, str):
@@ -28,7 +26,10 @@ def rollback_from_journal(journal_path: Path) -> None:
             continue
         ensure_directory(original.parent)
         shutil.move(str(target), str(original))
+    if not count:
+        console.print("[yellow]저널 데이터가 없습니다/No journal data found.[/yellow]")
+        return
     message = (
         "[green]총 {count}개 이동 롤백 완료/Rolled back {count} moves.[/green]"
-    ).format(count=len(entries))
+    ).format(count=count)
     console.print(message)
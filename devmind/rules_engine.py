@@ -4,22 +4,70 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Union
 
-from .config import BucketRule, FileDocument, RuleConfig
+from .config import BucketRule, FileDocument, RuleConfig, RuleDocument
 from .utils import (
+    KeywordMatcher,
+    compile_keyword_matcher,
+    decode_json,
     get_console,
-    load_documents,
+    iter_rule_rows,
     load_yaml_or_json_dict,
     save_json,
-    score_match,
 )
 
 console = get_console()
 
+ScorableDocument = Union[FileDocument, RuleDocument]
+
+MATCHER_FIELDS: Dict[str, str] = {
+    "name": "name_keywords",
+    "dir": "dir_keywords",
+    "content": "code_hints",
+    "imports": "imports",
+    "titles": "title_keywords",
+}
+
+
+def bucket_matchers(rule: BucketRule) -> Dict[str, KeywordMatcher]:
+    """버킷 키워드 매처 조회(지연 컴파일)/Get bucket matchers, compiling lazily."""
+
+    if not rule.matchers:
+        rule.matchers = {
+            field_name: compile_keyword_matcher(getattr(rule, attribute))
+            for field_name, attribute in MATCHER_FIELDS.items()
+        }
+    return rule.matchers
+
+
+_RULE_CONFIG_CACHE: Dict[Path, Tuple[int, RuleConfig]] = {}
+
+
+def clear_rule_cache() -> None:
+    """규칙 설정 캐시 초기화/Clear rule configuration cache."""
+
+    _RULE_CONFIG_CACHE.clear()
+
 
 def load_rule_config(path: Path) -> RuleConfig:
-    """규칙 설정 로드/Load rule configuration."""
+    """규칙 설정 로드(mtime 기준 캐시)/Load rule configuration, cached by mtime."""
+
+    try:
+        resolved = path.resolve()
+        mtime_ns = resolved.stat().st_mtime_ns
+    except OSError:
+        return _parse_rule_config(path)
+    cached = _RULE_CONFIG_CACHE.get(resolved)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    rule_config = _parse_rule_config(resolved)
+    _RULE_CONFIG_CACHE[resolved] = (mtime_ns, rule_config)
+    return rule_config
+
+
+def _parse_rule_config(path: Path) -> RuleConfig:
+    """규칙 설정 파싱/Parse rule configuration."""
 
     data = load_yaml_or_json_dict(path)
     buckets_raw = data.get("buckets", {})
@@ -30,7 +78,7 @@ def load_rule_config(path: Path) -> RuleConfig:
     buckets = {
         str(name): BucketRule(
             name=str(name),
-            exts=[str(ext).lower() for ext in config.get("exts", [])],
+            exts=frozenset(str(ext).lower() for ext in config.get("exts", [])),
             name_keywords=[str(item) for item in config.get("name_keywords", [])],
             dir_keywords=[str(item) for item in config.get("dir_keywords", [])],
             code_hints=[str(item) for item in config.get("code_hints", [])],
@@ -46,6 +94,8 @@ def load_rule_config(path: Path) -> RuleConfig:
         if isinstance(weights_raw, dict)
         else {}
     )
+    for rule in buckets.values():
+        bucket_matchers(rule)
     hints_raw = data.get("project_hints", [])
     project_hints = [str(item) for item in hints_raw]
     return RuleConfig(buckets=buckets, weights=weights, project_hints=project_hints)
@@ -61,47 +111,90 @@ class ScoredDocument:
     reasons: List[str]
 
 
-def score_document(document: FileDocument, rule_config: RuleConfig) -> ScoredDocument:
-    """문서 규칙 스코어링/Score document for rules."""
+@dataclass(slots=True)
+class _PreparedBucket:
+    """스코어링용 사전 계산 버킷/Bucket precomputed for scoring."""
+
+    name: str
+    exts: FrozenSet[str]
+    fields: List[Tuple[str, KeywordMatcher, int, int]]
+    max_score: int
+
+
+@dataclass(slots=True)
+class _PreparedRules:
+    """스코어링용 사전 계산 규칙/Rules precomputed for scoring."""
+
+    buckets: List[_PreparedBucket]
+    field_weights: Dict[str, int]
+    mimetype_weight: int
+
+
+def _prepare_rules(rule_config: RuleConfig) -> _PreparedRules:
+    """문서 공통 규칙 데이터 사전 계산/Precompute rule data shared by all documents."""
+
+    weights = rule_config.weights
+    content_weight = weights.get("content", 1)
+    field_weights = {
+        "name": weights.get("name", 1),
+        "dir": weights.get("dir", 1),
+        "content": content_weight,
+        "imports": content_weight,
+        "titles": content_weight,
+    }
+    buckets: List[_PreparedBucket] = []
+    for bucket_name, rule in rule_config.buckets.items():
+        matchers = bucket_matchers(rule)
+        fields = [
+            (
+                field_name,
+                matchers[field_name],
+                weight,
+                max(weight, 0) * len(matchers[field_name].keywords),
+            )
+            for field_name, weight in field_weights.items()
+            if matchers[field_name].keywords
+        ]
+        max_score = sum(bound for _, _, _, bound in fields)
+        buckets.append(_PreparedBucket(bucket_name, rule.exts, fields, max_score))
+    return _PreparedRules(buckets, field_weights, weights.get("mimetype", 1))
+
+
+def _score_prepared(
+    document: ScorableDocument, prepared: _PreparedRules
+) -> ScoredDocument:
+    """사전 계산 규칙으로 스코어링/Score document with precomputed rules."""
 
     best_bucket = "archive"
     best_score = 0
     best_reasons: List[str] = ["fallback"]
-    for bucket_name, rule in rule_config.buckets.items():
+    texts = {
+        "name": document.name.lower(),
+        "dir": document.dir_hint.lower(),
+        "content": document.sample_text.lower(),
+        "imports": " ".join(document.imports_first).lower(),
+        "titles": " ".join(document.md_headings).lower(),
+    }
+    for bucket in prepared.buckets:
+        remaining = bucket.max_score
         score = 0
         reasons: List[str] = []
-        if document.ext in rule.exts:
-            score += rule_config.weights.get("mimetype", 1)
+        if document.ext in bucket.exts:
+            score += prepared.mimetype_weight
             reasons.append(f"ext:{document.ext}")
-        name_score, name_matches = score_match(document.name, rule.name_keywords)
-        if name_score:
-            score += name_score * rule_config.weights.get("name", 1)
-            reasons.append(f"name:{','.join(name_matches)}")
-        dir_score, dir_matches = score_match(document.dir_hint, rule.dir_keywords)
-        if dir_score:
-            score += dir_score * rule_config.weights.get("dir", 1)
-            reasons.append(f"dir:{','.join(dir_matches)}")
-        content_score, content_matches = score_match(
-            document.sample_text, rule.code_hints
-        )
-        if content_score:
-            score += content_score * rule_config.weights.get("content", 1)
-            reasons.append(f"content:{','.join(content_matches)}")
-        import_score, import_matches = score_match(
-            " ".join(document.imports_first), rule.imports
-        )
-        if import_score:
-            score += import_score * rule_config.weights.get("content", 1)
-            reasons.append(f"imports:{','.join(import_matches)}")
-        title_score, title_matches = score_match(
-            " ".join(document.md_headings), rule.title_keywords
-        )
-        if title_score:
-            score += title_score * rule_config.weights.get("content", 1)
-            reasons.append(f"titles:{','.join(title_matches)}")
+        if score + remaining <= best_score:
+            continue
+        for field_name, matcher, weight, bound in bucket.fields:
+            remaining -= bound
+            field_score, matches = matcher.match(texts[field_name])
+            if field_score:
+                score += field_score * weight
+                reasons.append(f"{field_name}:{','.join(matches)}")
+            if score + remaining <= best_score:
+                break
         if score > best_score:
             best_score = score
-            best_bucket = bucket_name
+            best_bucket = bucket.name
             best_reasons = reasons or ["matched"]
     return ScoredDocument(
         doc_id=document.doc_id,
@@ -111,6 +204,51 @@ def score_document(document: FileDocument, rule_config: RuleConfig) -> ScoredDoc
     )
 
 
+def score_document(
+    document: ScorableDocument, rule_config: RuleConfig
+) -> ScoredDocument:
+    """문서 규칙 스코어링/Score document for rules."""
+
+    return _score_prepared(document, _prepare_rules(rule_config))
+
+
+def score_documents(
+    documents: Iterable[ScorableDocument], rule_config: RuleConfig
+) -> List[ScoredDocument]:
+    """문서 일괄 스코어링/Score documents in batch."""
+
+    prepared = _prepare_rules(rule_config)
+    return [_score_prepared(document, prepared) for document in documents]
+
+
+def iter_documents_for_rules(db_path: Path) -> Iterator[RuleDocument]:
+    """규칙용 문서 스트리밍 로드/Stream documents for rule scoring."""
+
+    for row in iter_rule_rows(db_path):
+        legacy_payload = row[7]
+        if legacy_payload is not None:
+            document = FileDocument.from_dict(decode_json(legacy_payload))
+            yield RuleDocument(
+                document.doc_id,
+                document.ext,
+                document.name,
+                document.dir_hint,
+                document.sample_text,
+                document.imports_first,
+                document.md_headings,
+            )
+            continue
+        yield RuleDocument(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            decode_json(row[5]),
+            decode_json(row[6]),
+        )
+
+
 def apply_rules(
     db_path: Path,
     rule_config_path: Path,
@@ -118,22 +256,20 @@ def apply_rules(
 ) -> List[Dict[str, object]]:
     """규칙 적용 실행/Execute rule application."""
 
-    documents = [FileDocument.from_dict(item) for item in load_documents(db_path)]
+    documents = list(iter_documents_for_rules(db_path))
     if not documents:
         console.print("[yellow]스캔 데이터가 없습니다/No scan data found.[/yellow]")
         return []
     config = load_rule_config(rule_config_path)
-    results: List[Dict[str, object]] = []
-    for document in documents:
-        scored = score_document(document, config)
-        results.append(
-            {
-                "doc_id": scored.doc_id,
-                "bucket": scored.best_bucket,
-                "score": scored.score,
-                "reasons": scored.reasons,
-            }
-        )
+    results: List[Dict[str, object]] = [
+        {
+            "doc_id": scored.doc_id,
+            "bucket": scored.best_bucket,
+            "score": scored.score,
+            "reasons": scored.reasons,
+        }
+        for scored in score_documents(documents, config)
+    ]
     save_json(output_path, results)
     message = (
         "[green]총 {count}개 파일 규칙 분류 완료/Completed rule classification"
@@ -3,34 +3,48 @@
 from __future__ import annotations
 
 import csv
+import io
 import json
 import mimetypes
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import asdict
+import os
+import re
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from .config import FileDocument, ScanConfig
 from .utils import (
-    compute_blake3,
     ensure_directory,
     generate_doc_id,
     get_console,
+    hash_file_with_head,
     iter_with_progress,
     mask_sensitive_text,
+    save_json,
     store_documents,
 )
 
 console = get_console()
 
+# str.splitlines()와 같은 줄 경계/Same line boundaries as str.splitlines().
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_START = f"(?:^|(?<=[{_LINE_BREAKS}]))"
+_IMPORT_LINE_PATTERN = re.compile(
+    f"{_LINE_START}[^\\S{_LINE_BREAKS}]*(?:import |from )[^{_LINE_BREAKS}]*"
+)
+_HEADING_LINE_PATTERN = re.compile(f"{_LINE_START}#[^{_LINE_BREAKS}]*")
 
-def _read_text_sample(path: Path, sample_bytes: int) -> str:
-    """텍스트 샘플 추출/Extract text sample."""
 
-    try:
-        raw = path.read_bytes()[:sample_bytes]
-    except OSError:
-        return ""
+def _decode_sample(raw: bytes) -> str:
+    """샘플 바이트 디코딩 및 마스킹/Decode and mask sample bytes."""
+
     try:
         decoded = raw.decode("utf-8")
     except UnicodeDecodeError:
@@ -42,14 +56,12 @@ def _extract_imports(text: str) -> List[str]:
     """임포트 목록 추출/Extract imports list."""
 
     imports: List[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("import "):
+    for match in _IMPORT_LINE_PATTERN.finditer(text):
+        stripped = match.group().strip()
+        if stripped.startswith("import ") or " import " in stripped:
             imports.append(stripped)
-        elif stripped.startswith("from ") and " import " in stripped:
-            imports.append(stripped)
-        if len(imports) >= 5:
-            break
+            if len(imports) >= 5:
+                break
     return imports
 
 
@@ -71,13 +83,12 @@ def _extract_markdown_headings(text: str) -> List[str]:
     """마크다운 헤더 추출/Extract markdown headings."""
 
     headings: List[str] = []
-    for line in text.splitlines():
-        if line.startswith("#"):
-            stripped = line.strip("# ")
-            if stripped:
-                headings.append(stripped)
-        if len(headings) >= 5:
-            break
+    for match in _HEADING_LINE_PATTERN.finditer(text):
+        stripped = match.group().strip("# ")
+        if stripped:
+            headings.append(stripped)
+            if len(headings) >= 5:
+                break
     return headings
 
 
@@ -93,16 +104,17 @@ def _extract_json_keys(text: str) -> List[str]:
     return []
 
 
-def _extract_csv_header(path: Path) -> List[str]:
-    """CSV 헤더 추출/Extract CSV header."""
+def _extract_csv_header(head: bytes) -> List[str]:
+    """CSV 헤더 추출(선두 바이트)/Extract CSV header from head bytes."""
 
     try:
-        with path.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.reader(handle)
-            header = next(reader, [])
-    except (OSError, UnicodeDecodeError):
-        header = []
-    return header[:20]
+        text = head.decode("utf-8")
+    except UnicodeDecodeError as error:
+        if error.start < len(head) - 3:
+            return []
+        text = head[: error.start].decode("utf-8")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    return next(reader, [])[:20]
 
 
 def _detect_mimetype(path: Path) -> str:
@@ -112,33 +124,56 @@ def _detect_mimetype(path: Path) -> str:
     return guess or "application/octet-stream"
 
 
-def _scan_file(path: Path, config: ScanConfig) -> Optional[FileDocument]:
-    """단일 파일 스캔/Scan single file."""
+@dataclass(slots=True)
+class _FileHead:
+    """I/O 단계 결과/Result of the I/O stage."""
+
+    path: Path
+    size: int
+    mtime: float
+    digest: str
+    sample: bytes
+
+
+def _read_file_head(
+    path: Path, config: ScanConfig, entry: Optional[os.DirEntry[str]] = None
+) -> Optional[_FileHead]:
+    """파일 상태·해시·샘플 읽기(I/O 단계)/Stat, hash and sample file (I/O stage)."""
 
     try:
-        size = path.stat().st_size
-        mtime = path.stat().st_mtime
+        stat_result = entry.stat() if entry is not None else path.stat()
+        if stat_result.st_size > config.max_size_bytes:
+            return None
+        digest, sample = hash_file_with_head(
+            path, config.sample_bytes, stat_result.st_size
+        )
     except OSError:
         return None
-    if size > config.max_size_bytes:
-        return None
-    digest = compute_blake3(path)
+    return _FileHead(path, stat_result.st_size, stat_result.st_mtime, digest, sample)
+
+
+def _build_document(head: _FileHead) -> FileDocument:
+    """메타 추출(CPU 단계)/Extract metadata (CPU stage)."""
+
+    path = head.path
+    digest = head.digest
     doc_id = generate_doc_id(path, digest)
-    sample_text = _read_text_sample(path, config.sample_bytes)
+    sample_text = _decode_sample(head.sample)
     mimetype_value = _detect_mimetype(path)
     imports = _extract_imports(sample_text)
     top_comment = _extract_top_comment(sample_text)
     headings = _extract_markdown_headings(sample_text)
     json_keys = _extract_json_keys(sample_text)
-    csv_header = _extract_csv_header(path) if path.suffix.lower() == ".csv" else []
+    ext = path.suffix.lower()
+    csv_header = _extract_csv_header(head.sample) if ext == ".csv" else []
     dir_hint = str(path.parent.name)
     return FileDocument(
         doc_id=doc_id,
         path=path,
         name=path.name,
-        ext=path.suffix.lower(),
-        size=size,
-        mtime=mtime,
+        ext=ext,
+        size=head.size,
+        mtime=head.mtime,
         blake3=digest,
         mimetype=mimetype_value,
         dir_hint=dir_hint,
@@ -151,37 +186,106 @@ def _scan_file(path: Path, config: ScanConfig) -> Optional[FileDocument]:
     )
 
 
+def _read_entry_head(
+    entry: os.DirEntry[str], config: ScanConfig
+) -> Optional[_FileHead]:
+    """디렉터리 항목 읽기(캐시된 stat 재사용)/Read directory entry reusing its stat."""
+
+    return _read_file_head(Path(entry.path), config, entry)
+
+
+def _walk_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """os.scandir 기반 파일 스트리밍 순회/Stream files using os.scandir."""
+
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+        # rglob과 같은 전위 순서 유지/Keep rglob's pre-order directory sequence.
+        stack.extend(reversed(subdirs))
+
+
+def _scan_file(path: Path, config: ScanConfig) -> Optional[FileDocument]:
+    """단일 파일 스캔/Scan single file."""
+
+    head = _read_file_head(path, config)
+    if head is None:
+        return None
+    return _build_document(head)
+
+
+def _hand_off_reads(
+    done: Iterable[Future[Optional[_FileHead]]],
+    reads: Dict[Future[Optional[_FileHead]], int],
+    builds: Dict[Future[FileDocument], int],
+    cpu_pool: ThreadPoolExecutor,
+) -> None:
+    """완료된 읽기를 CPU 단계로 전달/Hand completed reads to the CPU stage."""
+
+    for future in done:
+        index = reads.pop(future)
+        head = future.result()
+        if head is not None:
+            builds[cpu_pool.submit(_build_document, head)] = index
+
+
+def _collect_builds(
+    done: Iterable[Future[FileDocument]],
+    builds: Dict[Future[FileDocument], int],
+    results: Dict[int, FileDocument],
+) -> None:
+    """완료된 문서 수집/Collect completed documents."""
+
+    for future in done:
+        results[builds.pop(future)] = future.result()
+
+
 def scan(config: ScanConfig) -> List[FileDocument]:
     """경로 스캔 실행/Execute path scanning."""
 
-    documents: List[FileDocument] = []
     paths = [Path(path).expanduser() for path in config.paths]
     ensure_directory(config.cache_path.parent)
-    with ThreadPoolExecutor() as executor:
-        futures = []
+    cpu_workers = os.cpu_count() or 1
+    io_workers = min(32, cpu_workers * 4)
+    max_inflight = max(64, cpu_workers * 4)
+    results: Dict[int, FileDocument] = {}
+    with ThreadPoolExecutor(max_workers=io_workers) as io_pool, ThreadPoolExecutor(
+        max_workers=cpu_workers
+    ) as cpu_pool:
+        reads: Dict[Future[Optional[_FileHead]], int] = {}
+        builds: Dict[Future[FileDocument], int] = {}
+        index = 0
         for root in paths:
             if not root.exists():
                 console.print(f"[yellow]경로 없음/Path missing:[/] {root}")
                 continue
-            for file_path in iter_with_progress(
-                list(root.rglob("*")),
+            for entry in iter_with_progress(
+                _walk_files(root),
                 description=f"스캔 중/Scanning {root}",
             ):
-                if file_path.is_file():
-                    futures.append(executor.submit(_scan_file, file_path, config))
-        for future in futures:
-            document = future.result()
-            if document:
-                documents.append(document)
-    serialized = []
-    for document in documents:
-        doc_dict = asdict(document)
-        doc_dict["path"] = str(document.path)
-        serialized.append(doc_dict)
+                reads[io_pool.submit(_read_entry_head, entry, config)] = index
+                index += 1
+                if len(reads) >= max_inflight:
+                    done, _ = wait(reads, return_when=FIRST_COMPLETED)
+                    _hand_off_reads(done, reads, builds, cpu_pool)
+                if len(builds) >= max_inflight:
+                    built, _ = wait(builds, return_when=FIRST_COMPLETED)
+                    _collect_builds(built, builds, results)
+        _hand_off_reads(as_completed(list(reads)), reads, builds, cpu_pool)
+        _collect_builds(as_completed(list(builds)), builds, results)
+    documents = [results[position] for position in sorted(results)]
+    serialized = [document.to_dict() for document in documents]
     store_documents(config.cache_path, serialized)
-    ensure_directory(config.output_path.parent)
-    with config.output_path.open("w", encoding="utf-8") as handle:
-        json.dump(serialized, handle, ensure_ascii=False, indent=2)
+    save_json(config.output_path, serialized)
     message = (
         "[green]총 {count}개 파일 스캔 완료/Completed scanning {count} files.[/green]"
     ).format(count=len(documents))
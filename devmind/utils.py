@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import importlib
+import itertools
 import json
 import os
 import re
 import sqlite3
+import threading
 import time
 import uuid
 from contextlib import contextmanager
@@ -19,20 +22,38 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Optional,
     Protocol,
+    Sequence,
     Tuple,
     TypeVar,
     cast,
 )
 
 T = TypeVar("T")
-HasherFactory = Callable[[], "HashProtocol"]
+HasherFactory = Callable[..., "HashProtocol"]
+
+HASH_CHUNK_BYTES = 1024 * 1024
+MMAP_MIN_BYTES = 64 * 1024
+JSONL_BUFFER_BYTES = 1024 * 1024
+SQLITE_BATCH_ROWS = 1000
 
 UUID_NAMESPACE = uuid.UUID("12345678-1234-5678-1234-567812345678")
+_UUID_NAMESPACE_BYTES = UUID_NAMESPACE.bytes
 
 PATH_PATTERN = re.compile(r"([A-Za-z]:\\\\[^\s]+|/[^\s]+)")
 EMAIL_PATTERN = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 DIGIT_PATTERN = re.compile(r"\d{4,}")
+SENSITIVE_PATTERN = re.compile(
+    f"(?P<path>{PATH_PATTERN.pattern})"
+    f"|(?P<email>{EMAIL_PATTERN.pattern})"
+    f"|(?P<digits>{DIGIT_PATTERN.pattern})"
+)
+SENSITIVE_REPLACEMENTS: Dict[str, str] = {
+    "path": "[PATH]",
+    "email": "[EMAIL]",
+    "digits": "####",
+}
 
 
 def ensure_directory(path: Path) -> None:
@@ -59,6 +80,7 @@ class HashProtocol(Protocol):
 
 
 _BLAKE3_FACTORY: HasherFactory | None = None
+_ORJSON_MODULE: Any | None = None
 
 
 def _load_blake3_factory() -> HasherFactory | None:
@@ -79,8 +101,49 @@ def _load_blake3_factory() -> HasherFactory | None:
     return None
 
 
-def get_console() -> ConsoleProtocol:
-    """콘솔 인스턴스 제공/Provide console instance."""
+def _load_orjson_module() -> Any | None:
+    """orjson 모듈 로드/Load orjson module."""
+
+    global _ORJSON_MODULE
+    if _ORJSON_MODULE is not None:
+        return _ORJSON_MODULE
+    try:
+        _ORJSON_MODULE = importlib.import_module("orjson")
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return _ORJSON_MODULE
+
+
+def encode_json(data: object, indent: bool = False) -> bytes:
+    """JSON 바이트 직렬화(orjson 선호)/Serialize JSON bytes preferring orjson."""
+
+    orjson_module = _load_orjson_module()
+    if orjson_module is not None:
+        option = orjson_module.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson_module.OPT_INDENT_2
+        return cast(bytes, orjson_module.dumps(data, option=option))
+    text = json.dumps(data, ensure_ascii=False, indent=2 if indent else None)
+    return text.encode("utf-8")
+
+
+def decode_json(data: bytes | str) -> Any:
+    """JSON 역직렬화(orjson 선호)/Deserialize JSON preferring orjson."""
+
+    orjson_module = _load_orjson_module()
+    if orjson_module is not None:
+        return orjson_module.loads(data)
+    return json.loads(data)
+
+
+def _encode_jsonl_lines(rows: Iterable[Dict[str, Any]]) -> bytes:
+    """JSONL 바이트 버퍼 생성/Encode rows into a JSONL byte buffer."""
+
+    return b"".join(encode_json(row) + b"\n" for row in rows)
+
+
+def _create_console() -> ConsoleProtocol:
+    """콘솔 인스턴스 생성/Create console instance."""
 
     try:
         console_module = importlib.import_module("rich.console")
@@ -101,6 +164,28 @@ def get_console() -> ConsoleProtocol:
     return cast(ConsoleProtocol, SimpleConsole())
 
 
+class _LazyConsole:
+    """첫 출력 시 생성되는 콘솔/Console created on first print."""
+
+    __slots__ = ("_console",)
+
+    def __init__(self) -> None:
+        self._console: ConsoleProtocol | None = None
+
+    def print(self, message: str) -> None:
+        """메시지 출력/Print message."""
+
+        if self._console is None:
+            self._console = _create_console()
+        self._console.print(message)
+
+
+def get_console() -> ConsoleProtocol:
+    """지연 콘솔 제공/Provide lazily created console."""
+
+    return _LazyConsole()
+
+
 def iter_with_progress(iterable: Iterable[T], description: str = "") -> Iterator[T]:
     """진행 표시 반복기/Iterate with optional progress."""
 
@@ -141,34 +226,67 @@ def load_yaml_or_json_dict(path: Path) -> Dict[str, Any]:
     return _ensure_dict(loaded)
 
 
-def compute_blake3(path: Path) -> str:
-    """파일 해시 계산(BLAKE3 선호)/Compute file hash preferring BLAKE3."""
+def hash_file_with_head(
+    path: Path, head_bytes: int, size: Optional[int] = None
+) -> Tuple[str, bytes]:
+    """단일 읽기로 해시와 선두 바이트 반환/Hash file and return head in one read.
+
+    BLAKE3 사용 시 MMAP_MIN_BYTES 이상 파일은 update_mmap으로 해시한다/
+    With BLAKE3, files of MMAP_MIN_BYTES or more are hashed via update_mmap.
+    """
 
     factory = _load_blake3_factory()
     hasher: HashProtocol
     if factory is not None:
-        hasher = factory()
+        hasher = factory(max_threads=getattr(factory, "AUTO", 1))
+        update_mmap = getattr(hasher, "update_mmap", None)
+        if callable(update_mmap):
+            if size is None:
+                size = os.path.getsize(path)
+            if size >= MMAP_MIN_BYTES:
+                with path.open("rb") as handle:
+                    head = handle.read(head_bytes)
+                update_mmap(os.fspath(path))
+                return hasher.hexdigest(), head
     else:
         hasher = cast(HashProtocol, hashlib.blake2b(digest_size=32))
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
+        head = handle.read(head_bytes)
+        hasher.update(head)
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
             hasher.update(chunk)
-    return hasher.hexdigest()
+    return hasher.hexdigest(), head
+
+
+def _sensitive_replacement(match: re.Match[str]) -> str:
+    """매칭 그룹별 마스킹 토큰/Masking token for the matched group."""
+
+    return SENSITIVE_REPLACEMENTS[cast(str, match.lastgroup)]
 
 
 def mask_sensitive_text(value: str) -> str:
     """민감 정보 마스킹/Mask sensitive data."""
 
-    masked = PATH_PATTERN.sub("[PATH]", value)
-    masked = EMAIL_PATTERN.sub("[EMAIL]", masked)
-    masked = DIGIT_PATTERN.sub("####", masked)
-    return masked
+    return SENSITIVE_PATTERN.sub(_sensitive_replacement, value)
 
 
 def generate_doc_id(path: Path, digest: str) -> str:
-    """문서 ID 생성/Generate document identifier."""
+    """문서 ID 생성/Generate document identifier.
 
-    return str(uuid.uuid5(UUID_NAMESPACE, f"{path.as_posix()}::{digest}"))
+    uuid.uuid5(UUID_NAMESPACE, ...)와 같은 값을 UUID 객체 없이 만든다/
+    Produces the same value as uuid.uuid5(UUID_NAMESPACE, ...) without a UUID object.
+    """
+
+    hasher = hashlib.sha1(_UUID_NAMESPACE_BYTES, usedforsecurity=False)
+    hasher.update(f"{path.as_posix()}::{digest}".encode("utf-8"))
+    raw = bytearray(hasher.digest()[:16])
+    raw[6] = (raw[6] & 0x0F) | 0x50
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    hex_value = raw.hex()
+    return (
+        f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-"
+        f"{hex_value[16:20]}-{hex_value[20:]}"
+    )
 
 
 def now_ts() -> float:
@@ -177,13 +295,26 @@ def now_ts() -> float:
     return time.time()
 
 
+FAST_INGEST_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
 @contextmanager
-def sqlite_connection(db_path: Path) -> Iterator[sqlite3.Connection]:
+def sqlite_connection(
+    db_path: Path, fast: bool = False
+) -> Iterator[sqlite3.Connection]:
     """SQLite 연결 컨텍스트/SQLite connection context."""
 
     ensure_directory(db_path.parent)
     connection = sqlite3.connect(db_path)
     connection.row_factory = sqlite3.Row
+    if fast:
+        for pragma in FAST_INGEST_PRAGMAS:
+            connection.execute(pragma)
     try:
         yield connection
     finally:
@@ -191,22 +322,88 @@ def sqlite_connection(db_path: Path) -> Iterator[sqlite3.Connection]:
         connection.close()
 
 
+DOCUMENT_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ext", "TEXT"),
+    ("name", "TEXT"),
+    ("dir_hint", "TEXT"),
+    ("sample_text", "TEXT"),
+    ("imports_first_json", "TEXT"),
+    ("md_headings_json", "TEXT"),
+)
+
+
+def _ensure_documents_table(connection: sqlite3.Connection) -> None:
+    """문서 테이블 생성 및 컬럼 마이그레이션/Create documents table and add columns."""
+
+    connection.execute(
+        """
+        CREATE TABLE IF NOT EXISTS documents (
+            doc_id TEXT PRIMARY KEY,
+            payload TEXT NOT NULL
+        )
+        """
+    )
+    existing = {row[1] for row in connection.execute("PRAGMA table_info(documents)")}
+    for column, column_type in DOCUMENT_COLUMNS:
+        if column not in existing:
+            connection.execute(
+                f"ALTER TABLE documents ADD COLUMN {column} {column_type}"
+            )
+
+
+def _document_row(doc: Dict[str, Any]) -> Tuple[Any, ...]:
+    """문서 행 튜플 생성/Build document row tuple."""
+
+    return (
+        doc["doc_id"],
+        json.dumps(doc, ensure_ascii=False, separators=(",", ":")),
+        str(doc.get("ext", "")),
+        str(doc.get("name", "")),
+        str(doc.get("dir_hint", "")),
+        str(doc.get("sample_text", "")),
+        json.dumps(doc.get("imports_first", []), ensure_ascii=False),
+        json.dumps(doc.get("md_headings", []), ensure_ascii=False),
+    )
+
+
 def store_documents(db_path: Path, documents: Iterable[Dict[str, Any]]) -> None:
     """문서 메타데이터 저장/Store document metadata."""
 
+    with sqlite_connection(db_path, fast=True) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        _ensure_documents_table(connection)
+        statement = """
+            INSERT OR REPLACE INTO documents (
+                doc_id, payload, ext, name, dir_hint, sample_text,
+                imports_first_json, md_headings_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """
+        rows = map(_document_row, documents)
+        while batch := list(itertools.islice(rows, SQLITE_BATCH_ROWS)):
+            connection.executemany(statement, batch)
+
+
+def iter_rule_rows(db_path: Path) -> Iterator[Tuple[Any, ...]]:
+    """규칙용 컬럼 스트리밍 조회/Stream columns needed by the rules engine.
+
+    컬럼 추가 이전에 저장된 행은 마지막 요소로 payload를 함께 반환한다/
+    Rows stored before the columns existed also return their payload last.
+    """
+
+    if not db_path.exists():
+        return
     with sqlite_connection(db_path) as connection:
-        connection.execute(
+        _ensure_documents_table(connection)
+        cursor = connection.execute(
             """
-            CREATE TABLE IF NOT EXISTS documents (
-                doc_id TEXT PRIMARY KEY,
-                payload TEXT NOT NULL
-            )
+            SELECT doc_id, ext, name, dir_hint, sample_text,
+                   imports_first_json, md_headings_json,
+                   CASE WHEN ext IS NULL THEN payload END
+            FROM documents
             """
         )
-        connection.executemany(
-            "INSERT OR REPLACE INTO documents (doc_id, payload) VALUES (?, ?)",
-            ((doc["doc_id"], json.dumps(doc, ensure_ascii=False)) for doc in documents),
-        )
+        for row in cursor:
+            yield tuple(row)
 
 
 def load_documents(db_path: Path) -> List[Dict[str, Any]]:
@@ -219,39 +416,83 @@ def load_documents(db_path: Path) -> List[Dict[str, Any]]:
         return [json.loads(row[0]) for row in cursor.fetchall()]
 
 
+def load_plan_index(db_path: Path) -> Dict[str, Dict[str, Any]]:
+    """계획용 문서 색인(doc_id → path/blake3)/Index doc_id to path and blake3.
+
+    payload 전체 대신 SQLite json_extract로 필요한 필드만 읽는다/
+    Reads only the needed fields via SQLite json_extract, not whole payloads.
+    """
+
+    if not db_path.exists():
+        return {}
+    with sqlite_connection(db_path) as connection:
+        try:
+            cursor = connection.execute(
+                """
+                SELECT doc_id,
+                       json_extract(payload, '$.path'),
+                       json_extract(payload, '$.blake3')
+                FROM documents
+                """
+            )
+        except sqlite3.OperationalError:
+            return {
+                str(item.get("doc_id", "")): item
+                for item in load_documents(db_path)
+                if "doc_id" in item
+            }
+        return {
+            doc_id: {"path": path, "blake3": digest}
+            for doc_id, path, digest in cursor
+        }
+
+
 def write_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
     """JSONL 파일 작성/Write JSONL file."""
 
     ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as handle:
+    with path.open("wb", buffering=JSONL_BUFFER_BYTES) as handle:
         for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False) + os.linesep)
+            handle.write(encode_json(row))
+            handle.write(b"\n")
 
 
 def append_jsonl(path: Path, rows: Iterable[Dict[str, Any]]) -> None:
     """JSONL 파일 추가 작성/Append JSONL file."""
 
+    payload = _encode_jsonl_lines(rows)
     ensure_directory(path.parent)
-    with path.open("a", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False) + os.linesep)
+    with path.open("ab") as handle:
+        handle.write(payload)
 
 
-def read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """JSONL 파일 읽기/Read JSONL file."""
+def read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """JSONL 파일 스트리밍 읽기/Stream JSONL file entries."""
 
     if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as handle:
-        return [json.loads(line) for line in handle if line.strip()]
+        return
+    with path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield decode_json(line)
+
+
+def read_jsonl_reversed(path: Path) -> Iterator[Dict[str, Any]]:
+    """JSONL 역순 스트리밍 읽기/Stream JSONL entries in reverse order."""
+
+    if not path.exists():
+        return
+    data = path.read_bytes()
+    for line in reversed(data.splitlines()):
+        if line.strip():
+            yield decode_json(line)
 
 
 def save_json(path: Path, data: object) -> None:
     """JSON 파일 저장/Save JSON file."""
 
     ensure_directory(path.parent)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    path.write_bytes(encode_json(data, indent=True))
 
 
 def load_json(path: Path) -> object:
@@ -259,8 +500,125 @@ def load_json(path: Path) -> object:
 
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return decode_json(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_optional_module(name: str) -> Any | None:
+    """선택 모듈 로드/Load optional module."""
+
+    try:
+        return importlib.import_module(name)
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+
+
+class KeywordMatcher:
+    """소문자 텍스트용 다중 키워드 매처/Multi-keyword matcher for lowercased text."""
+
+    __slots__ = ("keywords", "_lowered", "_unique")
+
+    def __init__(self, keywords: Sequence[str]) -> None:
+        self.keywords = list(keywords)
+        self._lowered = [keyword.lower() for keyword in self.keywords]
+        self._unique = frozenset(self._lowered)
+
+    def _hits(self, lowered: str) -> set[str]:
+        """포함된 소문자 키워드 집합/Set of lowercased keywords found."""
+
+        return {keyword for keyword in self._unique if keyword in lowered}
+
+    def match(self, lowered: str) -> Tuple[int, List[str]]:
+        """키워드 매칭 점수/Score keyword matches on lowercased text."""
+
+        if not self.keywords:
+            return 0, []
+        hits = self._hits(lowered)
+        matches = [
+            keyword
+            for keyword, keyword_lower in zip(self.keywords, self._lowered)
+            if keyword_lower in hits
+        ]
+        return len(matches), matches
+
+
+class _AhoCorasickMatcher(KeywordMatcher):
+    """Aho–Corasick 오토마톤 매처/Aho–Corasick automaton matcher."""
+
+    __slots__ = ("_automaton", "_always")
+
+    def __init__(self, keywords: Sequence[str], module: Any) -> None:
+        super().__init__(keywords)
+        self._automaton = module.Automaton()
+        for keyword in self._unique:
+            if keyword:
+                self._automaton.add_word(keyword, keyword)
+        self._automaton.make_automaton()
+        self._always = {""} if "" in self._unique else set()
+
+    def _hits(self, lowered: str) -> set[str]:
+        """한 번의 순회로 키워드 탐색/Find keywords in a single pass."""
+
+        hits = set(self._always)
+        hits.update(value for _, value in self._automaton.iter(lowered))
+        return hits
+
+
+class _HyperscanMatcher(KeywordMatcher):
+    """Hyperscan 다중 패턴 매처/Hyperscan multi-pattern matcher."""
+
+    __slots__ = ("_database", "_patterns", "_always", "_local", "_module")
+
+    def __init__(self, keywords: Sequence[str], module: Any) -> None:
+        super().__init__(keywords)
+        self._module = module
+        self._patterns = [keyword for keyword in self._unique if keyword]
+        self._database = module.Database()
+        self._database.compile(
+            expressions=[
+                "".join(f"\\x{byte:02x}" for byte in keyword.encode("utf-8")).encode()
+                for keyword in self._patterns
+            ],
+            ids=list(range(len(self._patterns))),
+            elements=len(self._patterns),
+            flags=[module.HS_FLAG_SINGLEMATCH] * len(self._patterns),
+        )
+        self._always = {""} if "" in self._unique else set()
+        self._local = threading.local()
+
+    def _hits(self, lowered: str) -> set[str]:
+        """스레드별 스크래치로 한 번에 스캔/Scan once using a per-thread scratch."""
+
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._module.Scratch(self._database)
+            self._local.scratch = scratch
+        found: set[int] = set()
+        self._database.scan(
+            lowered.encode("utf-8"),
+            match_event_handler=lambda pattern_id, *_: found.add(pattern_id),
+            scratch=scratch,
+        )
+        hits = set(self._always)
+        hits.update(self._patterns[pattern_id] for pattern_id in found)
+        return hits
+
+
+def compile_keyword_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """키워드 매처 컴파일/Compile keyword matcher.
+
+    hyperscan → pyahocorasick → 순수 파이썬 순으로 선택한다/
+    Prefers hyperscan, then pyahocorasick, then pure Python.
+    """
+
+    if any(keywords):
+        hyperscan_module = _load_optional_module("hyperscan")
+        if hyperscan_module is not None:
+            return _HyperscanMatcher(keywords, hyperscan_module)
+    module = _load_optional_module("ahocorasick")
+    if module is not None and any(keywords):
+        return _AhoCorasickMatcher(keywords, module)
+    return KeywordMatcher(keywords)
 
 
 def score_match(value: str, keywords: Iterable[str]) -> Tuple[int, List[str]]:
@@ -1,7 +1,11 @@
 
 #!/usr/bin/env python3
-import json, sys, argparse, datetime
-from collections import defaultdict, deque
+import json, re, sys, argparse, datetime
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
 
 TYPE_BASE = {
     "doc": 0.8,
@@ -13,6 +17,8 @@ TYPE_BASE = {
     "test": 1.1
 }
 
+TITLE_KW_RE = re.compile(r"reflect|dependency|graph|mcp")
+
 def load_tasks(p):
     with open(p, "r", encoding="utf-8") as f:
         data = json.load(f)
@@ -21,53 +27,44 @@ def load_tasks(p):
     return data
 
 def topo_order(tasks):
-    # Build graph
+    # Build graph on 0..N-1 indices
+    n = len(tasks)
     id_index = {t["id"]: i for i, t in enumerate(tasks)}
-    indeg = defaultdict(int)
-    adj = defaultdict(list)
-    for t in tasks:
-        deps = t.get("deps", [])
-        for d in deps:
-            adj[d].append(t["id"])
-            indeg[t["id"]] += 1
-        if t["id"] not in indeg:
-            indeg[t["id"]] = indeg.get(t["id"], 0)
-    # Kahn
-    q = deque([tid for tid, deg in indeg.items() if deg == 0])
-    order = []
-    while q:
-        u = q.popleft()
-        order.append(u)
+    indeg = [0] * n
+    adj = [[] for _ in range(n)]
+    for i, t in enumerate(tasks):
+        for d in t.get("deps", []):
+            j = id_index.get(d)
+            if j is not None:
+                adj[j].append(i)
+            indeg[i] += 1
+    # Kahn (list queue + head pointer)
+    q = [i for i in range(n) if indeg[i] == 0]
+    head = 0
+    while head < len(q):
+        u = q[head]
+        head += 1
         for v in adj[u]:
             indeg[v] -= 1
             if indeg[v] == 0:
                 q.append(v)
+    order = [tasks[i]["id"] for i in q]
     # Detect cycle
     cycle = None
-    if len(order) != len(tasks):
+    if len(order) != n:
         # crude cycle detection: nodes with indeg>0
-        cycle = [tid for tid, deg in indeg.items() if deg > 0]
+        cycle = [tasks[i]["id"] for i in range(n) if indeg[i] > 0]
     return order, cycle, adj
 
-def score_complexity(task, adj, reverse_adj):
+def score_complexity(task, deps, dependents):
     base = TYPE_BASE.get(task.get("type","code"), 1.0)
-    deps = len(task.get("deps", []))
-    dependents = len(adj.get(task["id"], []))
     title_bonus = 0.0
-    title = (task.get("title") or "").lower()
-    if any(k in title for k in ["reflect", "dependency", "graph", "mcp"]):
+    if TITLE_KW_RE.search((task.get("title") or "").lower()):
         title_bonus += 0.2
     # simple formula bounded to [0.8, 3.0]
     cx = base + 0.2*deps + 0.1*dependents + title_bonus
     return max(0.8, min(3.0, round(cx, 2)))
 
-def build_reverse(adj):
-    rev = defaultdict(list)
-    for u, vs in adj.items():
-        for v in vs:
-            rev[v].append(u)
-    return rev
-
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--in", dest="inp", required=True)
@@ -78,41 +75,42 @@ def main():
     data = load_tasks(args.inp)
     tasks = data["tasks"]
     order, cycle, adj = topo_order(tasks)
-    rev = build_reverse(adj)
 
     # attach order index + recompute complexity
     order_index = {tid: i for i, tid in enumerate(order)}
     for t in tasks:
         t["order"] = order_index.get(t["id"], 9999)
-    for t in tasks:
-        t["complexity"] = float(score_complexity(t, adj, rev))
+    dep_count = [len(t.get("deps", [])) for t in tasks]
+    dependents_count = [len(vs) for vs in adj]
+    for i, t in enumerate(tasks):
+        t["complexity"] = float(score_complexity(t, dep_count[i], dependents_count[i]))
 
     data["meta"] = data.get("meta", {})
-    data["meta"]["reflected_at"] = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    data["meta"]["reflected_at"] = now.isoformat().replace("+00:00", "Z")
     data["meta"]["topo_order"] = order
 
-    with open(args.outp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(args.outp, "wb", buffering=1 << 16) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.outp, "w", encoding="utf-8", buffering=1 << 16) as f:
+            json.dump(data, f, indent=2)
 
     # write report
-    lines = []
-    lines.append("# Tasks Reflect Report")
-    lines.append("Generated: " + data["meta"]["reflected_at"])
-    lines.append("")
+    lines = ["# Tasks Reflect Report", "Generated: " + data["meta"]["reflected_at"], ""]
     if cycle:
-        lines.append("## ⚠️ Cycle Detected")
-        lines.append("- Nodes in cycle or blocked: " + ", ".join(cycle))
+        lines.extend(("## ⚠️ Cycle Detected", "- Nodes in cycle or blocked: " + ", ".join(cycle)))
     else:
         lines.append("## ✅ No Cycles")
-    lines.append("")
-    lines.append("## Execution Order")
-    for i, tid in enumerate(order):
-        lines.append(f"{i+1}. {tid}")
-    lines.append("")
-    lines.append("## Complexity Summary")
-    for t in sorted(tasks, key=lambda x: x["order"]):
-        lines.append(f"- {t['id']}: type={t.get('type')} deps={len(t.get('deps',[]))} dependents={len(adj.get(t['id'],[]))} complexity={t['complexity']} order={t['order']}")
-    with open(args.report, "w", encoding="utf-8") as f:
+    lines.extend(("", "## Execution Order"))
+    lines.extend(f"{i+1}. {tid}" for i, tid in enumerate(order))
+    lines.extend(("", "## Complexity Summary"))
+    lines.extend(
+        f"- {tasks[i]['id']}: type={tasks[i].get('type')} deps={dep_count[i]} dependents={dependents_count[i]} complexity={tasks[i]['complexity']} order={tasks[i]['order']}"
+        for i in sorted(range(len(tasks)), key=lambda x: tasks[x]["order"])
+    )
+    with open(args.report, "w", encoding="utf-8", buffering=1 << 16) as f:
         f.write("\n".join(lines))
 
 if __name__ == "__main__":
@@ -2,19 +2,57 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import os
 import shutil
+import sqlite3
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from devmind.clusterer import ClusterInput, cluster_documents
-from devmind.config import ClusterProject, ClusterResult, ScanConfig
-from devmind.organizer import build_plans, execute_plans, load_schema
+from devmind import organizer
+from devmind.clusterer import ClusterInput, _normalize_label, cluster_documents
+from devmind.config import (
+    ClusterProject,
+    ClusterResult,
+    FileDocument,
+    OrganizePlan,
+    ScanConfig,
+)
+from devmind.organizer import (
+    build_plans,
+    execute_plans,
+    load_schema,
+    resolve_target_path,
+)
 from devmind.reporting import generate_summary
 from devmind.rollback import rollback_from_journal
-from devmind.rules_engine import apply_rules
+from devmind.rules_engine import (
+    apply_rules,
+    clear_rule_cache,
+    iter_documents_for_rules,
+    load_rule_config,
+)
 from devmind.scanner import scan
-from devmind.utils import load_documents, load_json
+from devmind.utils import (
+    KeywordMatcher,
+    _AhoCorasickMatcher,
+    _HyperscanMatcher,
+    compile_keyword_matcher,
+    load_json,
+    load_plan_index,
+    score_match,
+    store_documents,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_repo_text(name: str) -> str:
+    """저장소 설정 파일 1회 읽기/Read a repository config file once."""
+
+    return Path(name).read_text(encoding="utf-8")
 
 
 def _load_scores_map(path: Path) -> dict[str, str]:
@@ -28,56 +66,61 @@ def _load_scores_map(path: Path) -> dict[str, str]:
         items = candidate if isinstance(candidate, list) else []
     else:
         items = []
-    mapping: dict[str, str] = {}
-    for entry in items:
-        if not isinstance(entry, dict):
-            continue
-        doc_id = str(entry.get("doc_id", ""))
-        if not doc_id:
-            continue
-        mapping[doc_id] = str(entry.get("bucket", "archive"))
-    return mapping
+    return {
+        entry["doc_id"]: entry.get("bucket", "archive")
+        for entry in items
+        if isinstance(entry, dict) and entry.get("doc_id")
+    }
 
 
-@pytest.fixture()
-def sample_workspace(tmp_path: Path) -> Path:
-    """샘플 작업공간 생성/Create sample workspace."""
+@pytest.fixture(scope="session")
+def sample_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """샘플 작업공간 생성(세션 공유, 읽기 전용)/Create shared read-only workspace."""
 
     fixture_dir = Path("tests/fixtures/sample_project")
-    workspace = tmp_path / "workspace"
+    workspace = tmp_path_factory.mktemp("fixtures") / "workspace"
     shutil.copytree(fixture_dir, workspace)
     return workspace
 
 
-def test_scan_collects_metadata(sample_workspace: Path, tmp_path: Path) -> None:
-    """스캔이 메타데이터를 수집한다/Scan collects metadata."""
+@pytest.fixture(scope="session")
+def scanned_workspace(
+    sample_workspace: Path, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[ScanConfig, list[FileDocument]]:
+    """샘플 작업공간 1회 스캔/Scan the sample workspace once per session."""
 
+    cache_dir = tmp_path_factory.mktemp("scan")
     config = ScanConfig(
         paths=[sample_workspace],
         max_size_bytes=1_000_000,
         sample_bytes=1024,
-        cache_path=tmp_path / "scan.db",
-        output_path=tmp_path / "scan.json",
+        cache_path=cache_dir / "scan.db",
+        output_path=cache_dir / "scan.json",
     )
-    documents = scan(config)
+    return config, scan(config)
+
+
+def test_scan_collects_metadata(
+    scanned_workspace: tuple[ScanConfig, list[FileDocument]],
+) -> None:
+    """스캔이 메타데이터를 수집한다/Scan collects metadata."""
+
+    config, documents = scanned_workspace
     names = {doc.name for doc in documents}
     assert names == {"app.py", "README.md", "data.csv"}
     app_doc = next(doc for doc in documents if doc.name == "app.py")
     assert "if __name__" in app_doc.sample_text
     assert app_doc.imports_first == []
+    csv_doc = next(doc for doc in documents if doc.name == "data.csv")
+    assert csv_doc.csv_header == ["col1", "col2"]
 
 
-def test_rules_classification(sample_workspace: Path, tmp_path: Path) -> None:
+def test_rules_classification(
+    scanned_workspace: tuple[ScanConfig, list[FileDocument]], tmp_path: Path
+) -> None:
     """규칙 분류가 예상 버킷을 반환한다/Rules classification returns expected bucket."""
 
-    config = ScanConfig(
-        paths=[sample_workspace],
-        max_size_bytes=1_000_000,
-        sample_bytes=1024,
-        cache_path=tmp_path / "scan.db",
-        output_path=tmp_path / "scan.json",
-    )
-    documents = scan(config)
+    config, documents = scanned_workspace
     rules_path = tmp_path / "rules.yml"
     rules_path.write_text(
         """
@@ -100,17 +143,102 @@ def test_rules_classification(sample_workspace: Path, tmp_path: Path) -> None:
     assert mapping[app_doc.doc_id] == "scripts"
 
 
-def test_cluster_and_plan(sample_workspace: Path, tmp_path: Path) -> None:
+def test_normalize_label_keeps_unicode_word_chars() -> None:
+    """라벨 정규화가 유니코드 문자를 유지한다/Label normalization keeps Unicode chars."""
+
+    assert _normalize_label("My Project.v2") == "my_project_v2"
+    assert _normalize_label("__data-set__") == "data-set"
+    assert _normalize_label("프로젝트 A") == "프로젝트_a"
+
+
+def test_rule_config_cache_tracks_mtime(tmp_path: Path) -> None:
+    """규칙 캐시는 파일 변경 시 갱신된다/Rule cache refreshes on file change."""
+
+    clear_rule_cache()
+    rules_path = tmp_path / "rules.yml"
+    rules_path.write_text("buckets:\n  src:\n    exts: ['.py']\n", encoding="utf-8")
+    first = load_rule_config(rules_path)
+    assert load_rule_config(rules_path) is first
+    rules_path.write_text("buckets:\n  docs:\n    exts: ['.md']\n", encoding="utf-8")
+    stat_result = rules_path.stat()
+    os.utime(rules_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1))
+    second = load_rule_config(rules_path)
+    assert second is not first
+    assert list(second.buckets) == ["docs"]
+
+
+def test_rule_documents_read_legacy_payload_rows(tmp_path: Path) -> None:
+    """이전 스키마 행도 규칙 문서로 읽는다/Legacy payload rows load as rule docs."""
+
+    doc = {
+        "doc_id": "a",
+        "path": "/x/a.py",
+        "ext": ".py",
+        "size": 1,
+        "mtime": 1.0,
+        "blake3": "h",
+        "name": "a.py",
+        "dir_hint": "x",
+        "sample_text": "import os",
+        "imports_first": ["os"],
+        "md_headings": [],
+        "csv_header": [],
+    }
+    db_path = tmp_path / "legacy.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE documents (doc_id TEXT PRIMARY KEY, payload TEXT NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO documents VALUES (?, ?)", ("a", json.dumps(doc))
+        )
+    legacy = list(iter_documents_for_rules(db_path))
+    store_documents(db_path, [{**doc, "doc_id": "b"}])
+    rows = list(iter_documents_for_rules(db_path))
+    assert legacy[0].imports_first == ["os"]
+    assert [item.doc_id for item in rows] == ["a", "b"]
+    assert rows[1].sample_text == "import os"
+
+
+def test_keyword_matcher_matches_score_match() -> None:
+    """컴파일된 매처가 기존 점수와 같다/Compiled matcher agrees with score_match."""
+
+    keywords = ["Core", "utils", "core", "v2", "missing"]
+    text = "core_UTILS_v2.py"
+    expected = score_match(text, keywords)
+    assert expected == (4, ["Core", "utils", "core", "v2"])
+    assert compile_keyword_matcher(keywords).match(text.lower()) == expected
+
+
+@pytest.mark.parametrize("module_name", [None, "ahocorasick", "hyperscan"])
+def test_keyword_matcher_backends_match_score_match(module_name: str | None) -> None:
+    """모든 매처 구현이 기존 점수와 같다/Every matcher backend agrees with score_match."""
+
+    if module_name is None:
+        matcher_type: Any = KeywordMatcher
+    else:
+        module = pytest.importorskip(module_name)
+        backend = {"ahocorasick": _AhoCorasickMatcher, "hyperscan": _HyperscanMatcher}
+        matcher_type = functools.partial(backend[module_name], module=module)
+    keywords = ["Core", "utils", "core", "", "데이터", "Ünïcode", "utils", "missing"]
+    for text in ("core_UTILS_데이터_ÜNÏCODE.py", "readme.md", ""):
+        expected = score_match(text, keywords)
+        assert matcher_type(keywords).match(text.lower()) == expected
+    assert matcher_type(keywords).match("core_utils.py")[1] == [
+        "Core",
+        "utils",
+        "core",
+        "",
+        "utils",
+    ]
+
+
+def test_cluster_and_plan(
+    scanned_workspace: tuple[ScanConfig, list[FileDocument]], tmp_path: Path
+) -> None:
     """군집과 계획이 생성된다/Cluster and plans are generated."""
 
-    config = ScanConfig(
-        paths=[sample_workspace],
-        max_size_bytes=1_000_000,
-        sample_bytes=1024,
-        cache_path=tmp_path / "scan.db",
-        output_path=tmp_path / "scan.json",
-    )
-    documents = scan(config)
+    config, documents = scanned_workspace
     scores_path = tmp_path / "scores.json"
     rules_path = Path("rules.yml")
     apply_rules(config.cache_path, rules_path, scores_path)
@@ -133,7 +261,7 @@ def test_cluster_and_plan(sample_workspace: Path, tmp_path: Path) -> None:
     assert cluster_result.projects
     schema_path = tmp_path / "schema.yml"
     schema_path.write_text(
-        Path("schema.yml").read_text(encoding="utf-8"),
+        _read_repo_text("schema.yml"),
         encoding="utf-8",
     )
     schema = load_schema(schema_path)
@@ -143,11 +271,29 @@ def test_cluster_and_plan(sample_workspace: Path, tmp_path: Path) -> None:
         conflict_policy=schema.conflict_policy,
         mode="move",
     )
-    scan_index = {item["doc_id"]: item for item in load_documents(config.cache_path)}
+    scan_index = load_plan_index(config.cache_path)
     plans = build_plans(cluster_result, schema, scores, scan_index)
     assert plans
 
 
+def test_resolve_target_path_avoids_existing_files(tmp_path: Path) -> None:
+    """기존 파일과 충돌하지 않는다/Target paths avoid existing files."""
+
+    scripts_dir = tmp_path / "scripts"
+    scripts_dir.mkdir()
+    (scripts_dir / "run.py").write_text("", encoding="utf-8")
+    directory_names: dict[Path, set[str]] = {}
+    first, suffix = resolve_target_path(
+        tmp_path, "scripts", "run.py", "abcdef0123", directory_names
+    )
+    second, _ = resolve_target_path(
+        tmp_path, "scripts", "run.py", "abcdef0123", directory_names
+    )
+    assert suffix == "abcdef0"
+    assert first == scripts_dir / "run__abcdef0.py"
+    assert second == scripts_dir / "run__abcdef0_1.py"
+
+
 def test_execute_and_rollback(tmp_path: Path) -> None:
     """이동 및 롤백 흐름/Move and rollback flow."""
 
@@ -170,7 +316,7 @@ def test_execute_and_rollback(tmp_path: Path) -> None:
     scores_path = tmp_path / "scores.json"
     rules_path = tmp_path / "rules.yml"
     rules_path.write_text(
-        Path("rules.yml").read_text(encoding="utf-8"),
+        _read_repo_text("rules.yml"),
         encoding="utf-8",
     )
     apply_rules(config.cache_path, rules_path, scores_path)
@@ -186,7 +332,7 @@ def test_execute_and_rollback(tmp_path: Path) -> None:
     cluster_result = ClusterResult(projects=[project])
     schema_path = tmp_path / "schema.yml"
     schema_path.write_text(
-        Path("schema.yml").read_text(encoding="utf-8"),
+        _read_repo_text("schema.yml"),
         encoding="utf-8",
     )
     schema = load_schema(schema_path)
@@ -196,7 +342,7 @@ def test_execute_and_rollback(tmp_path: Path) -> None:
         conflict_policy=schema.conflict_policy,
         mode="move",
     )
-    scan_index = {item["doc_id"]: item for item in load_documents(config.cache_path)}
+    scan_index = load_plan_index(config.cache_path)
     plans = build_plans(cluster_result, schema, scores, scan_index)
     journal_path = tmp_path / "journal.jsonl"
     execute_plans(plans, journal_path, "move")
@@ -214,3 +360,41 @@ def test_execute_and_rollback(tmp_path: Path) -> None:
     rollback_from_journal(journal_path)
     assert file_a.exists()
     assert file_b.exists()
+
+
+def test_execute_plans_journals_completed_moves_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """부분 실패 시 완료분 저널 기록/Journal completed moves when one move fails."""
+
+    plans = []
+    for name in ("ok.py", "fail.py"):
+        source = tmp_path / "source" / name
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("print('x')", encoding="utf-8")
+        plans.append(
+            OrganizePlan(
+                name,
+                "project_001",
+                "proj",
+                "src",
+                str(source),
+                tmp_path / "target" / name,
+                "abcdef0",
+            )
+        )
+    original_move = organizer._move_file
+
+    def failing_move(source: str, target: Path) -> None:
+        if source.endswith("fail.py"):
+            raise PermissionError(source)
+        original_move(source, target)
+
+    monkeypatch.setattr(organizer, "_move_file", failing_move)
+    journal_path = tmp_path / "journal.jsonl"
+    with pytest.raises(PermissionError):
+        execute_plans(plans, journal_path, "move")
+    rows = [json.loads(line) for line in journal_path.read_text("utf-8").splitlines()]
+    assert [row["doc_id"] for row in rows] == ["ok.py"]
+    rollback_from_journal(journal_path)
+    assert (tmp_path / "source" / "ok.py").exists()
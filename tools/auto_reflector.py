@@ -11,24 +11,50 @@
 
 import json
 import argparse
+import queue
 import subprocess
 import sys
 import time
 import logging
 import threading
 import hashlib
+import importlib.util
 import os
+import itertools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait as wait_futures
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml 기반 C 로더
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from pathlib import Path
 import schedule
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.observers.api import ObservedWatch
+from watchdog.events import (DirCreatedEvent, DirMovedEvent, FileClosedEvent, FileCreatedEvent, FileMovedEvent,
+                             FileSystemEventHandler)
 import requests
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from werkzeug.serving import make_server
+
+try:
+    from watchdog.observers.inotify import InotifyObserver as _InotifyObserver
+except Exception:  # Linux 이외 플랫폼
+    _InotifyObserver = None
+
+# inotify 사용 시 쓰기 완료(IN_CLOSE_WRITE)·생성·이동 이벤트만 구독 (디렉토리 생성·이동은 새 하위 트리 등록용)
+CLOSE_WRITE_EVENT_FILTER = [FileClosedEvent, FileCreatedEvent, FileMovedEvent, DirCreatedEvent, DirMovedEvent]
+
+try:
+    from waitress.server import create_server as _create_waitress_server
+except ImportError:  # waitress 미설치 시 werkzeug 스레드 서버 사용
+    _create_waitress_server = None
 
 # 로깅 설정
 logging.basicConfig(
@@ -41,6 +67,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # blake3 미설치 시 hashlib.blake2b 사용
+    _blake3 = None
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 Flask jsonify 사용
+    orjson = None
+
+def _load_tasks_reflect():
+    """같은 디렉터리의 tasks_reflect.py를 경로로 로드 (sys.path의 동명 모듈과 혼동 방지)"""
+    module_path = Path(__file__).with_name("tasks_reflect.py")
+    spec = importlib.util.spec_from_file_location("_auto_reflector_tasks_reflect", module_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module if hasattr(module, "run_cli") else None
+
+try:
+    _tasks_reflect = _load_tasks_reflect()
+except Exception:  # 모듈 로드 실패 시 서브프로세스 경로 사용
+    _tasks_reflect = None
+
+REFLECTION_TIMEOUT = 60  # 1분 타임아웃
+NOTIFICATION_TIMEOUT = 5
+_file_digest = getattr(hashlib, "file_digest", None)  # Python 3.11+
+
+HASH_CHUNK_SIZE = 64 * 1024
+HASH_DIGEST_SIZE = 16  # 32자 hex (기존 MD5 길이 유지)
+MAX_TRACKED_FILES = 4096
+MAX_HISTORY_EVENTS = 10_000
+
+def _new_blake2b():
+    """MD5와 같은 길이의 BLAKE2b 해셔 생성"""
+    return hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+
+def calculate_file_hash(file_path: str) -> str:
+    """파일 해시 계산 (64 KiB 단위 스트리밍, BLAKE3 우선)"""
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            if _blake3 is not None:
+                hasher = _blake3()
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    hasher.update(chunk)
+                return hasher.hexdigest(length=HASH_DIGEST_SIZE)
+            if _file_digest is not None:
+                # 중간 bytes 객체 없이 해시 버퍼로 직접 읽기 (Python 3.11+)
+                return _file_digest(f, _new_blake2b).hexdigest()
+            hasher = _new_blake2b()
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                hasher.update(chunk)
+            return hasher.hexdigest()
+    except Exception:
+        return ""
+
+def _remember(cache: OrderedDict, key: str, value) -> None:
+    """크기 제한 캐시에 값 기록 (가장 오래된 항목부터 제거)"""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > MAX_TRACKED_FILES:
+        cache.popitem(last=False)
+
 class ReflectionMode(Enum):
     """리플렉션 모드"""
     WATCH = "watch"          # 파일 변경 감지
@@ -62,6 +152,8 @@ class ReflectionConfig:
     webhook_port: int = 8080
     webhook_endpoints: List[str] = None
     notification_channels: List[str] = None
+    use_subprocess: bool = False  # True면 tasks_reflect.py를 별도 프로세스로 실행
+    ignore_directories: List[str] = None
     
     def __post_init__(self):
         if self.watch_directories is None:
@@ -72,6 +164,8 @@ class ReflectionConfig:
             self.webhook_endpoints = ["/reflect", "/update"]
         if self.notification_channels is None:
             self.notification_channels = ["console", "log"]
+        if self.ignore_directories is None:
+            self.ignore_directories = ["node_modules", "__pycache__", "venv"]
 
 @dataclass
 class ReflectionEvent:
@@ -84,88 +178,235 @@ class ReflectionEvent:
     duration: float
     error_message: Optional[str] = None
     triggered_by: str = "manual"
+    iso_ts: str = field(default="")  # 생성 시 1회 계산한 ISO 타임스탬프
+    
+    def __post_init__(self):
+        if not self.iso_ts:
+            self.iso_ts = self.timestamp.isoformat()
+
+class ReflectionHistory(deque):
+    """크기 제한 리플렉션 이력 (소요 시간 합계를 누적 관리)"""
+    
+    def __init__(self, maxlen: int = MAX_HISTORY_EVENTS):
+        super().__init__(maxlen=maxlen)
+        self.duration_sum = 0.0
+        self.first_timestamp: Optional[datetime] = None
+    
+    def append(self, event: ReflectionEvent):
+        if self.first_timestamp is None:
+            self.first_timestamp = event.timestamp
+        if len(self) == self.maxlen:
+            self.duration_sum -= self[0].duration
+        super().append(event)
+        self.duration_sum += event.duration
+    
+    def extend(self, events):
+        for event in events:
+            self.append(event)
+    
+    def clear(self):
+        super().clear()
+        self.duration_sum = 0.0
+        self.first_timestamp = None
+    
+    def average_duration(self) -> float:
+        """평균 소요 시간"""
+        return self.duration_sum / len(self) if self else 0
+    
+    def recent(self, limit: int) -> List[ReflectionEvent]:
+        """최근 이벤트 limit개 (list[-limit:]와 동일)"""
+        if limit > 0:
+            return list(itertools.islice(self, max(0, len(self) - limit), None))
+        return list(self)[-limit:]
 
 class FileChangeHandler(FileSystemEventHandler):
     """파일 변경 감지 핸들러"""
     
-    def __init__(self, auto_reflector: 'AutoReflector'):
+    def __init__(self, auto_reflector: 'AutoReflector', close_events: bool = False,
+                 watch_roots: Optional[List[str]] = None):
         self.auto_reflector = auto_reflector
-        self.file_hashes = {}
+        self.close_events = close_events  # True면 수정 대신 쓰기 완료(closed) 이벤트 처리
+        self.file_hashes: OrderedDict = OrderedDict()
         self.debounce_time = 2.0  # 2초 디바운스
-        self.last_triggered = {}
+        self.last_triggered: OrderedDict = OrderedDict()
+        self._stat_cache: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
+        self._ext_tuple = tuple(auto_reflector.config.watch_extensions)
+        self._ignored_dirs = frozenset(auto_reflector.config.ignore_directories)
+        # 긴 경로 우선으로 매칭해 중첩 루트에서도 가장 가까운 루트 기준 상대 경로 계산
+        self._watch_roots = tuple(sorted(
+            (os.path.join(os.path.abspath(root), "") for root in (watch_roots or [])),
+            key=len, reverse=True,
+        ))
+        self._cache_lock = threading.Lock()  # 해시 워커 간 캐시 갱신 보호
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
     
     def should_trigger_reflection(self, file_path: str) -> bool:
         """리플렉션 트리거 여부 판단"""
-        # 파일 확장자 확인
-        if not any(file_path.endswith(ext) for ext in self.auto_reflector.config.watch_extensions):
+        return self._passes_filters(file_path) and self._content_changed(file_path)
+    
+    def _passes_filters(self, file_path: str) -> bool:
+        """확장자·디바운스 확인 (디스패처 스레드에서 실행되는 저비용 검사)"""
+        # 파일 확장자 확인 (튜플 endswith 한 번)
+        if not file_path.endswith(self._ext_tuple):
+            return False
+        
+        # 숨김/제외 디렉토리 아래 경로 무시 (등록 단계에서 이미 제외하며 여기서는 안전망)
+        if self._in_ignored_directory(file_path):
             return False
         
         # 디바운스 확인
-        now = time.time()
-        if file_path in self.last_triggered:
-            if now - self.last_triggered[file_path] < self.debounce_time:
-                return False
+        now = time.monotonic()
+        last = self.last_triggered.get(file_path)
+        if last is not None and now - last < self.debounce_time:
+            return False
         
-        self.last_triggered[file_path] = now
+        _remember(self.last_triggered, file_path, now)
+        return True
+    
+    def _in_ignored_directory(self, file_path: str) -> bool:
+        """감시 루트 기준 상대 경로에 숨김(.)/제외 디렉토리가 포함되는지 확인"""
+        abs_path = os.path.abspath(file_path)
+        for root in self._watch_roots:
+            if abs_path.startswith(root):
+                abs_path = abs_path[len(root):]
+                break
+        directories = abs_path.split(os.sep)[:-1]
+        return any(part.startswith(".") or part in self._ignored_dirs for part in directories)
+    
+    def _content_changed(self, file_path: str) -> bool:
+        """stat 서명·해시로 실제 내용 변경 여부 확인"""
+        # mtime/크기가 같으면 해시 생략
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            st = None
+        if st is not None:
+            signature = (st.st_mtime_ns, st.st_size)
+            with self._cache_lock:
+                if self._stat_cache.get(file_path) == signature:
+                    return False
+                _remember(self._stat_cache, file_path, signature)
         
         # 파일 해시 확인
         try:
             current_hash = self._calculate_file_hash(file_path)
-            if file_path in self.file_hashes and self.file_hashes[file_path] == current_hash:
-                return False  # 파일 내용이 변경되지 않음
-            
-            self.file_hashes[file_path] = current_hash
-            return True
         except Exception as e:
             logger.warning(f"파일 해시 계산 실패 {file_path}: {e}")
             return True  # 안전을 위해 트리거
+        
+        with self._cache_lock:
+            if self.file_hashes.get(file_path) == current_hash:
+                return False  # 파일 내용이 변경되지 않음
+            _remember(self.file_hashes, file_path, current_hash)
+        return True
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """파일 해시 계산"""
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return calculate_file_hash(file_path)
     
     def on_modified(self, event):
         """파일 수정 이벤트 처리"""
+        if event.is_directory or self.close_events:
+            return
+        
+        self._handle_write(event.src_path)
+    
+    def on_closed(self, event):
+        """파일 쓰기 완료 이벤트 처리 (inotify IN_CLOSE_WRITE)"""
         if event.is_directory:
             return
         
-        file_path = event.src_path
-        if self.should_trigger_reflection(file_path):
-            logger.info(f"파일 변경 감지: {file_path}")
-            self.auto_reflector.trigger_reflection(
-                event_type="file_modified",
-                file_path=file_path,
-                triggered_by="file_watcher"
-            )
+        self._handle_write(event.src_path)
+    
+    def on_moved(self, event):
+        """파일 이동 이벤트 처리 (임시 파일 저장 후 rename)"""
+        if event.is_directory:
+            self._on_directory_added(event.dest_path)
+            return
+        
+        self._handle_write(event.dest_path)
     
     def on_created(self, event):
         """파일 생성 이벤트 처리"""
         if event.is_directory:
+            self._on_directory_added(event.src_path)
             return
         
-        file_path = event.src_path
-        if self.should_trigger_reflection(file_path):
-            logger.info(f"파일 생성 감지: {file_path}")
-            self.auto_reflector.trigger_reflection(
-                event_type="file_created",
-                file_path=file_path,
-                triggered_by="file_watcher"
-            )
+        self._handle_write(event.src_path, event_type="file_created")
+    
+    def _on_directory_added(self, directory: str):
+        """루트 바로 아래 새 디렉토리면 재귀 감시에 등록하고 등록 전에 생긴 파일을 처리"""
+        abs_dir = os.path.abspath(directory)
+        name = os.path.basename(abs_dir)
+        if os.path.join(os.path.dirname(abs_dir), "") not in self._watch_roots:
+            return  # 하위 트리는 이미 재귀 감시 중
+        if name.startswith(".") or name in self._ignored_dirs:
+            return
+        
+        self.auto_reflector._watch_new_directory(abs_dir)
+        for dirpath, dirnames, filenames in os.walk(abs_dir):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in self._ignored_dirs]
+            for filename in filenames:
+                self._handle_write(os.path.join(dirpath, filename), event_type="file_created")
+    
+    def _handle_write(self, file_path: str, event_type: str = "file_modified"):
+        """저비용 필터만 통과시키고 해시 비교는 워커 풀로 넘김"""
+        if not self._passes_filters(file_path):
+            return
+        
+        if self._hash_pool is None:
+            self._hash_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hash")
+        self._hash_pool.submit(self._check_and_trigger, file_path, event_type)
+    
+    def _check_and_trigger(self, file_path: str, event_type: str):
+        """해시 비교 후 변경 시 리플렉션 요청 (해시 워커 스레드)"""
+        if not self._content_changed(file_path):
+            return
+        
+        label = "생성" if event_type == "file_created" else "변경"
+        logger.info(f"파일 {label} 감지: {file_path}")
+        self.auto_reflector.enqueue_reflection(
+            event_type=event_type,
+            file_path=file_path,
+            triggered_by="file_watcher"
+        )
+    
+    def close(self):
+        """해시 워커 풀 종료"""
+        if self._hash_pool is not None:
+            self._hash_pool.shutdown(wait=False)
+            self._hash_pool = None
 
 class AutoReflector:
     """자동 리플렉션 시스템"""
     
     def __init__(self, config: ReflectionConfig):
         self.config = config
-        self.reflection_history: List[ReflectionEvent] = []
+        self.reflection_history = ReflectionHistory()
         self.observer = None
+        self._file_handler: Optional[FileChangeHandler] = None
+        self._watch_event_filter = None
+        self._subdir_watches: Dict[str, ObservedWatch] = {}  # 재귀 감시 중인 하위 디렉토리 (절대 경로)
         self.is_running = False
+        self._stop_event = threading.Event()
         self.webhook_app = None
         self.webhook_thread = None
+        self._webhook_shutdown: Optional[Callable[[], None]] = None
+        self._http: Optional[requests.Session] = None  # 웹훅 알림용 keep-alive 세션
+        self._notify_pool: Optional[ThreadPoolExecutor] = None
+        
+        # 파일 이벤트 병합 큐 (단일 소비자 스레드)
+        self.coalesce_window = 0.5  # 0.5초 동안 들어온 이벤트를 한 번에 처리
+        self._event_queue: "queue.Queue[Optional[Tuple[str, str, str]]]" = queue.Queue()
+        self._consumer: Optional[threading.Thread] = None
+        
+        # 인프로세스 리플렉션 실행기 (재진입 방지)
+        self._reflect_lock = threading.Lock()
+        self._pending_lock = threading.Lock()  # 실행 상태·대기 슬롯 보호
+        self._reflect_busy = False
+        self._pending_request: Optional[Tuple[str, str, str]] = None
+        self._reflect_executor: Optional[ThreadPoolExecutor] = None
+        self._output_dirs_ready = False  # 출력 디렉토리는 첫 리플렉션에서 1회 생성
         
         # 리플렉션 통계
         self.total_reflections = 0
@@ -176,30 +417,79 @@ class AutoReflector:
     def start_watch_mode(self):
         """파일 감시 모드 시작"""
         logger.info(f"파일 감시 모드 시작: {self.config.watch_directories}")
+        self._stop_event.clear()
         
         self.observer = Observer()
-        handler = FileChangeHandler(self)
-        
-        for directory in self.config.watch_directories:
-            if os.path.exists(directory):
-                self.observer.schedule(handler, directory, recursive=True)
-                logger.info(f"감시 디렉토리 추가: {directory}")
-            else:
-                logger.warning(f"감시 디렉토리가 존재하지 않음: {directory}")
+        close_events = _InotifyObserver is not None and isinstance(self.observer, _InotifyObserver)
+        targets = self._watch_targets()
+        watch_roots = [directory for directory, recursive in targets if not recursive]
+        handler = FileChangeHandler(self, close_events=close_events, watch_roots=watch_roots)
+        self._file_handler = handler
+        self._watch_event_filter = CLOSE_WRITE_EVENT_FILTER if close_events else None
+        self._subdir_watches.clear()
+        
+        for directory, recursive in targets:
+            watch = self.observer.schedule(handler, directory, recursive=recursive,
+                                           event_filter=self._watch_event_filter)
+            if recursive:
+                self._subdir_watches[os.path.abspath(directory)] = watch
+            logger.info(f"감시 디렉토리 추가: {directory} (recursive={recursive})")
         
         self.observer.start()
         self.is_running = True
+        self._wait_for_stop("파일 감시 모드")
+    
+    def _watch_targets(self) -> List[Tuple[str, bool]]:
+        """감시 대상 (경로, 재귀 여부) 목록
         
-        try:
-            while self.is_running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("파일 감시 모드 종료")
-            self.stop()
+        루트는 비재귀로, 하위 디렉토리는 숨김/제외 디렉토리를 건너뛰고 재귀로 등록하며
+        이미 등록된 트리 안의 경로는 중복 등록하지 않는다. 시작 후 루트 아래에 생긴
+        디렉토리는 FileChangeHandler가 디렉토리 생성 이벤트로 등록한다.
+        """
+        ignored = set(self.config.ignore_directories)
+        recursive_roots: List[str] = []
+        targets: List[Tuple[str, bool]] = []
+        
+        def covered(real_path: str) -> bool:
+            return any(real_path == root or real_path.startswith(root + os.sep) for root in recursive_roots)
+        
+        for directory in self.config.watch_directories:
+            if not os.path.isdir(directory):
+                logger.warning(f"감시 디렉토리가 존재하지 않음: {directory}")
+                continue
+            if covered(os.path.realpath(directory)):
+                continue
+            targets.append((directory, False))
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name.startswith(".") or entry.name in ignored:
+                        continue
+                    real_path = os.path.realpath(entry.path)
+                    if covered(real_path):
+                        continue
+                    recursive_roots.append(real_path)
+                    targets.append((entry.path, True))
+        return targets
+    
+    def _watch_new_directory(self, directory: str):
+        """시작 후 생성된 최상위 디렉토리를 재귀 감시에 등록 (삭제 후 재생성이면 기존 감시 교체)"""
+        observer, handler = self.observer, self._file_handler
+        if observer is None or handler is None:
+            return
+        
+        previous = self._subdir_watches.pop(directory, None)
+        if previous is not None:
+            observer.unschedule(previous)
+        self._subdir_watches[directory] = observer.schedule(handler, directory, recursive=True,
+                                                            event_filter=self._watch_event_filter)
+        logger.info(f"새 감시 디렉토리 추가: {directory}")
     
     def start_scheduled_mode(self):
         """스케줄 모드 시작"""
         logger.info(f"스케줄 모드 시작: {self.config.reflection_interval}초 간격")
+        self._stop_event.clear()
         
         # 스케줄 설정
         schedule.every(self.config.reflection_interval).seconds.do(
@@ -212,52 +502,59 @@ class AutoReflector:
         self.is_running = True
         
         try:
-            while self.is_running:
+            while not self._stop_event.is_set():
                 schedule.run_pending()
-                time.sleep(1)
+                # 다음 작업 시각까지 대기 (stop() 호출 시 즉시 깨어남)
+                idle_seconds = schedule.idle_seconds()
+                self._stop_event.wait(timeout=max(0.0, idle_seconds) if idle_seconds is not None else None)
         except KeyboardInterrupt:
             logger.info("스케줄 모드 종료")
             self.stop()
     
+    def _wait_for_stop(self, mode_name: str):
+        """stop() 호출 시까지 블로킹 대기"""
+        try:
+            self._stop_event.wait()
+        except KeyboardInterrupt:
+            logger.info(f"{mode_name} 종료")
+            self.stop()
+    
     def start_webhook_mode(self):
         """웹훅 모드 시작"""
         logger.info(f"웹훅 모드 시작: 포트 {self.config.webhook_port}")
+        self._stop_event.clear()
         
         self.webhook_app = Flask(__name__)
         self._setup_webhook_routes()
         
-        self.webhook_thread = threading.Thread(
-            target=self.webhook_app.run,
-            kwargs={'host': '0.0.0.0', 'port': self.config.webhook_port, 'debug': False}
-        )
+        serve, self._webhook_shutdown = self._create_webhook_server()
+        self.webhook_thread = threading.Thread(target=serve)
         self.webhook_thread.daemon = True
         self.webhook_thread.start()
         
         self.is_running = True
-        
-        try:
-            while self.is_running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("웹훅 모드 종료")
-            self.stop()
+        self._wait_for_stop("웹훅 모드")
     
     def start_daemon_mode(self):
         """데몬 모드 시작"""
         logger.info("데몬 모드 시작")
+        self._stop_event.clear()
         
         # 모든 모드 통합
         self._start_webhook_mode()
         self._start_scheduled_mode()
         
         self.is_running = True
-        
-        try:
-            while self.is_running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("데몬 모드 종료")
-            self.stop()
+        self._wait_for_stop("데몬 모드")
+    
+    def _create_webhook_server(self):
+        """웹훅 WSGI 서버 생성 (waitress 우선, 없으면 werkzeug 멀티스레드 서버)"""
+        host, port = '0.0.0.0', self.config.webhook_port
+        if _create_waitress_server is not None:
+            server = _create_waitress_server(self.webhook_app, host=host, port=port, threads=4)
+            return server.run, server.close
+        server = make_server(host, port, self.webhook_app, threaded=True)
+        return server.serve_forever, server.shutdown
     
     def _setup_webhook_routes(self):
         """웹훅 라우트 설정"""
@@ -277,6 +574,14 @@ class AutoReflector:
                     triggered_by="webhook"
                 )
                 
+                if success is None:
+                    # 실행 중인 리플렉션 뒤에 대기 - 결과는 /history에서 확인
+                    return jsonify({
+                        'queued': True,
+                        'message': 'Reflection queued behind a running reflection',
+                        'timestamp': datetime.now().isoformat()
+                    }), 202
+                
                 return jsonify({
                     'success': success,
                     'message': 'Reflection triggered successfully' if success else 'Reflection failed',
@@ -302,12 +607,12 @@ class AutoReflector:
         def get_history():
             """리플렉션 이력 조회"""
             limit = request.args.get('limit', 10, type=int)
-            recent_events = self.reflection_history[-limit:]
+            recent_events = self.reflection_history.recent(limit)
             
-            return jsonify({
+            payload = {
                 'events': [
                     {
-                        'timestamp': event.timestamp.isoformat(),
+                        'timestamp': event.iso_ts,
                         'event_type': event.event_type,
                         'file_path': event.file_path,
                         'success': event.success,
@@ -317,13 +622,74 @@ class AutoReflector:
                     }
                     for event in recent_events
                 ]
-            })
+            }
+            if orjson is not None:
+                return Response(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS), mimetype='application/json')
+            return jsonify(payload)
     
-    def trigger_reflection(self, event_type: str, file_path: str, triggered_by: str) -> bool:
-        """리플렉션 트리거"""
+    def enqueue_reflection(self, event_type: str, file_path: str, triggered_by: str):
+        """리플렉션 요청을 병합 큐에 추가"""
+        if self._consumer is None or not self._consumer.is_alive():
+            self._consumer = threading.Thread(target=self._drain_loop, daemon=True)
+            self._consumer.start()
+        self._event_queue.put((event_type, file_path, triggered_by))
+    
+    def _drain_loop(self):
+        """큐에 쌓인 이벤트를 병합하여 리플렉션 1회 실행"""
+        while True:
+            first = self._event_queue.get()
+            if first is None:
+                return
+            time.sleep(self.coalesce_window)
+            
+            pending = [first]
+            while True:
+                try:
+                    item = self._event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    return
+                pending.append(item)
+            
+            changed_paths = list(dict.fromkeys(file_path for _, file_path, _ in pending))
+            event_type, last_path, triggered_by = pending[-1]
+            if len(pending) > 1:
+                logger.info(f"파일 이벤트 {len(pending)}건 병합: {changed_paths}")
+            self.trigger_reflection(
+                event_type=event_type,
+                file_path=last_path,
+                triggered_by=triggered_by
+            )
+    
+    def trigger_reflection(self, event_type: str, file_path: str, triggered_by: str) -> Optional[bool]:
+        """리플렉션 트리거 (실행 1개 + 대기 1개로 제한, 대기 요청은 마지막 것만 유지)
+        
+        직접 실행했으면 그 실행의 성공 여부를, 실행 중인 리플렉션 뒤에 대기열로 합쳐졌으면 None을 반환한다.
+        대기 요청은 실행이 끝난 뒤 병합 큐 소비자 스레드로 넘겨 호출자는 자기 실행 직후 반환한다.
+        """
+        request = (event_type, file_path, triggered_by)
+        with self._pending_lock:
+            if self._reflect_busy:
+                self._pending_request = request
+                return None
+            self._reflect_busy = True
+        
+        try:
+            return self._run_reflection(*request)
+        finally:
+            with self._pending_lock:
+                follow_up = self._pending_request
+                self._pending_request = None
+                self._reflect_busy = False
+            if follow_up is not None:
+                self.enqueue_reflection(*follow_up)
+    
+    def _run_reflection(self, event_type: str, file_path: str, triggered_by: str) -> bool:
+        """리플렉션 1회 실행 및 이력 기록"""
         logger.info(f"리플렉션 트리거: {event_type} - {file_path} (by {triggered_by})")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         error_message = None
         
@@ -346,12 +712,13 @@ class AutoReflector:
         
         finally:
             self.total_reflections += 1
-            duration = time.time() - start_time
-            self.last_reflection_time = datetime.now()
+            duration = time.perf_counter() - start_time
+            now = datetime.now()
+            self.last_reflection_time = now
             
             # 이벤트 기록
             event = ReflectionEvent(
-                timestamp=datetime.now(),
+                timestamp=now,
                 event_type=event_type,
                 file_path=file_path,
                 file_hash=self._calculate_file_hash(file_path) if file_path else "",
@@ -371,66 +738,117 @@ class AutoReflector:
     def _execute_reflection(self) -> bool:
         """리플렉션 실행"""
         try:
-            # 출력 디렉토리 생성
-            output_dir = os.path.dirname(self.config.output_file)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            report_dir = os.path.dirname(self.config.report_file)
-            if report_dir and not os.path.exists(report_dir):
-                os.makedirs(report_dir)
+            if not self._output_dirs_ready:
+                self._prepare_output_dirs()
             
-            # 리플렉션 명령어 실행
-            command = [
-                "python", "tools/tasks_reflect.py",
-                "--in", self.config.input_file,
-                "--out", self.config.output_file,
-                "--report", self.config.report_file
-            ]
-            
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=60  # 1분 타임아웃
-            )
-            
-            if result.returncode == 0:
-                logger.info("리플렉션 명령어 실행 성공")
-                return True
-            else:
-                logger.error(f"리플렉션 명령어 실행 실패: {result.stderr}")
-                return False
+            with self._reflect_lock:
+                if self.config.use_subprocess or _tasks_reflect is None:
+                    return self._execute_reflection_subprocess()
+                return self._execute_reflection_in_process()
         
-        except subprocess.TimeoutExpired:
+        except Exception as e:
+            logger.error(f"리플렉션 실행 중 예외: {e}")
+            return False
+    
+    def _prepare_output_dirs(self):
+        """출력/리포트 디렉토리를 한 번만 생성 (이후 리플렉션은 stat/mkdir 생략)"""
+        for target in (self.config.output_file, self.config.report_file):
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+        self._output_dirs_ready = True
+    
+    def _execute_reflection_in_process(self) -> bool:
+        """tasks_reflect 모듈 직접 호출 (인터프리터 재기동 없음)"""
+        if self._reflect_executor is None:
+            self._reflect_executor = ThreadPoolExecutor(max_workers=1)
+        
+        args = argparse.Namespace(
+            input_file=self.config.input_file,
+            output_file=self.config.output_file,
+            report_file=self.config.report_file,
+            config_file=None
+        )
+        future = self._reflect_executor.submit(_tasks_reflect.run_cli, args)
+        try:
+            status = future.result(timeout=REFLECTION_TIMEOUT)
+        except FutureTimeoutError:
             logger.error("리플렉션 실행 타임아웃")
             return False
         except Exception as e:
-            logger.error(f"리플렉션 실행 중 예외: {e}")
+            logger.error(f"리플렉션 실행 실패: {e}")
+            return False
+        
+        if status == 0:
+            logger.info("리플렉션 실행 성공")
+            return True
+        logger.error(f"리플렉션 실행 실패: 종료 코드 {status}")
+        return False
+    
+    def _execute_reflection_subprocess(self) -> bool:
+        """tasks_reflect.py 서브프로세스 실행"""
+        command = [
+            "python", "tools/tasks_reflect.py",
+            "--in", self.config.input_file,
+            "--out", self.config.output_file,
+            "--report", self.config.report_file
+        ]
+        
+        # stdout은 버리고 stderr만 수집 (출력 버퍼링으로 인한 메모리 증가 방지)
+        proc = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        try:
+            _, stderr = proc.communicate(timeout=REFLECTION_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            logger.error("리플렉션 실행 타임아웃")
+            return False
+        
+        if proc.returncode == 0:
+            logger.info("리플렉션 명령어 실행 성공")
+            return True
+        else:
+            logger.error(f"리플렉션 명령어 실행 실패: {stderr}")
             return False
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """파일 해시 계산"""
-        try:
-            with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
-        except Exception:
-            return ""
+        return calculate_file_hash(file_path)
     
     def _send_notifications(self, event: ReflectionEvent):
-        """알림 발송"""
+        """알림 발송 (원격 채널은 스레드 풀에서 병렬 발송)"""
+        remote_futures = []
         for channel in self.config.notification_channels:
-            try:
-                if channel == "console":
-                    self._send_console_notification(event)
-                elif channel == "log":
-                    self._send_log_notification(event)
-                elif channel.startswith("webhook:"):
-                    self._send_webhook_notification(event, channel)
-                elif channel.startswith("email:"):
-                    self._send_email_notification(event, channel)
-            except Exception as e:
-                logger.warning(f"알림 발송 실패 ({channel}): {e}")
+            if channel in ("console", "log"):
+                self._dispatch_notification(event, channel)
+                continue
+            if self._notify_pool is None:
+                self._notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='notify')
+            if channel.startswith("webhook:") and self._http is None:
+                self._http = requests.Session()  # 워커 스레드 간 공유 세션은 여기서 한 번만 생성
+            remote_futures.append(self._notify_pool.submit(self._dispatch_notification, event, channel))
+        
+        if remote_futures:
+            _, not_done = wait_futures(remote_futures, timeout=NOTIFICATION_TIMEOUT)
+            if not_done:
+                logger.warning(f"알림 발송 시간 초과: {len(not_done)}건")
+    
+    def _dispatch_notification(self, event: ReflectionEvent, channel: str):
+        """채널별 알림 발송"""
+        try:
+            if channel == "console":
+                self._send_console_notification(event)
+            elif channel == "log":
+                self._send_log_notification(event)
+            elif channel.startswith("webhook:"):
+                self._send_webhook_notification(event, channel)
+            elif channel.startswith("email:"):
+                self._send_email_notification(event, channel)
+        except Exception as e:
+            logger.warning(f"알림 발송 실패 ({channel}): {e}")
     
     def _send_console_notification(self, event: ReflectionEvent):
         """콘솔 알림"""
@@ -454,7 +872,9 @@ class AutoReflector:
         }
         
         try:
-            response = requests.post(url, json=data, timeout=5)
+            if self._http is None:
+                self._http = requests.Session()
+            response = self._http.post(url, json=data, timeout=5)
             if response.status_code == 200:
                 logger.info(f"웹훅 알림 발송 성공: {url}")
             else:
@@ -472,14 +892,34 @@ class AutoReflector:
         logger.info("자동 리플렉션 중지 중...")
         
         self.is_running = False
+        self._stop_event.set()
         
         if self.observer:
             self.observer.stop()
             self.observer.join()
         
-        if self.webhook_thread and self.webhook_thread.is_alive():
-            # Flask 앱 종료는 별도 처리 필요
-            pass
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+        
+        if self._consumer and self._consumer.is_alive():
+            self._event_queue.put(None)
+        
+        if self._reflect_executor is not None:
+            self._reflect_executor.shutdown(wait=False)
+            self._reflect_executor = None
+        
+        if self._notify_pool is not None:
+            self._notify_pool.shutdown(wait=False)
+            self._notify_pool = None
+        
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        
+        if self._webhook_shutdown is not None:
+            self._webhook_shutdown()
+            self._webhook_shutdown = None
         
         logger.info("자동 리플렉션 중지 완료")
     
@@ -491,15 +931,15 @@ class AutoReflector:
             "failed_reflections": self.failed_reflections,
             "success_rate": (self.successful_reflections / self.total_reflections * 100) if self.total_reflections > 0 else 0,
             "last_reflection_time": self.last_reflection_time.isoformat() if self.last_reflection_time else None,
-            "average_duration": sum(event.duration for event in self.reflection_history) / len(self.reflection_history) if self.reflection_history else 0,
-            "uptime": time.time() - (self.reflection_history[0].timestamp.timestamp() if self.reflection_history else time.time())
+            "average_duration": self.reflection_history.average_duration(),
+            "uptime": time.time() - (self.reflection_history.first_timestamp.timestamp() if self.reflection_history.first_timestamp else time.time())
         }
 
 def load_config(config_file: str) -> ReflectionConfig:
     """설정 파일 로드"""
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
         
         return ReflectionConfig(**config_data)
     except Exception as e:
@@ -519,6 +959,7 @@ def main():
     parser.add_argument('--port', type=int, default=8080, help='웹훅 포트')
     parser.add_argument('--watch-dirs', nargs='+', default=['.', 'docs', 'src'], help='감시 디렉토리')
     parser.add_argument('--watch-exts', nargs='+', default=['.json', '.md', '.yaml', '.yml'], help='감시 확장자')
+    parser.add_argument('--subprocess', action='store_true', help='리플렉션을 별도 프로세스로 실행')
     
     args = parser.parse_args()
     
@@ -534,7 +975,8 @@ def main():
                 reflection_interval=args.interval,
                 webhook_port=args.port,
                 watch_directories=args.watch_dirs,
-                watch_extensions=args.watch_exts
+                watch_extensions=args.watch_exts,
+                use_subprocess=args.subprocess
             )
         
         # 자동 리플렉션 시스템 초기화
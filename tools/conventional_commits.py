@@ -11,18 +11,99 @@ Conventional Commits 자동화 및 릴리즈 태그 연동
 
 import json
 import argparse
+import functools
 import sys
 import os
 import re
 import subprocess
+import urllib.request
+from collections import defaultdict
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+# 모듈 로드 시 1회 컴파일
+_HEADER_RE = re.compile(r'^(\w+)(?:\(([^)]+)\))?(!)?:\s*(.+)$')
+_VERSION_TOML_RE_B = re.compile(rb'version\s*=\s*["\']([^"\']+)["\']')  # 바이트 패턴 (디코딩 생략)
+_SEMVER_TAG_RE = re.compile(r'^v?\d+\.\d+\.\d+')
+_GITHUB_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$')
+
+GIT_LOG_CHUNK_SIZE = 1 << 16  # git log 스트림 읽기 단위 (문자)
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_TIMEOUT = 30  # 초
+
+# Breaking Change 푸터 키워드 (줄 머리에서만 인정, '!' 마커는 헤더 정규식이 처리)
+_BREAKING_KEYWORDS = ('BREAKING CHANGE', 'BREAKING:')
+
+@functools.cache
+def _today() -> str:
+    """CHANGELOG 릴리즈 날짜 (프로세스당 1회 계산)"""
+    return datetime.now().strftime('%Y-%m-%d')
+
+def _join_lines(lines: List[str]) -> Optional[str]:
+    """줄 목록 결합 (빈 목록은 None, 한 줄은 join 없이 그대로)"""
+    if not lines:
+        return None
+    if len(lines) == 1:
+        return lines[0]
+    return '\n'.join(lines)
+
+def _iter_nul_records(stream) -> Iterator[str]:
+    """NUL로 구분된 레코드를 청크 단위로 읽으며 하나씩 반환"""
+    pending = ''
+    while True:
+        chunk = stream.read(GIT_LOG_CHUNK_SIZE)
+        if not chunk:
+            break
+        records = (pending + chunk).split('\0')
+        pending = records.pop()
+        yield from records
+    if pending:
+        yield pending
+
+class _GitSession:
+    """장기 실행 `git cat-file --batch-check` 프로세스로 객체 조회를 한 프로세스에서 처리"""
+    
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            ['git', 'cat-file', '--batch-check=%(objectname) %(objecttype)'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1
+        )
+    
+    def object_type(self, rev: str) -> Optional[str]:
+        """rev가 가리키는 객체 타입 (없으면 None)"""
+        try:
+            self._proc.stdin.write(rev + '\n')
+            self._proc.stdin.flush()
+        except BrokenPipeError:  # 저장소가 아니면 git이 즉시 종료
+            return None
+        line = self._proc.stdout.readline().rstrip('\n')
+        if not line or line.endswith(' missing') or line.endswith(' ambiguous'):
+            return None
+        return line.rpartition(' ')[2]
+    
+    def close(self):
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        self._proc.wait()
+    
+    def __enter__(self) -> '_GitSession':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 @dataclass
 class ConventionalCommit:
     """Conventional Commit 구조"""
+    # 인스턴스 __dict__ 제거 (대량 커밋 처리 시 메모리·속성 접근 비용 절감)
+    __slots__ = ('type', 'scope', 'description', 'body', 'footer', 'breaking_change', 'hash', 'date', 'author')
+    
     type: str
     scope: Optional[str]
     description: str
@@ -68,7 +149,7 @@ class ConventionalCommitsManager:
         }
         
         # Breaking Change 키워드
-        self.breaking_keywords = ['BREAKING CHANGE', 'BREAKING:', '!']
+        self.breaking_keywords = _BREAKING_KEYWORDS
         
         # 릴리즈 타입별 버전 증가
         self.version_bumps = {
@@ -76,6 +157,12 @@ class ConventionalCommitsManager:
             'minor': ['feat'],         # 새로운 기능
             'patch': ['fix', 'perf', 'refactor', 'docs', 'style', 'test', 'build', 'ci', 'chore']  # 기타
         }
+        
+        self._cached_version: Optional[str] = None  # get_current_version 결과 캐시
+        
+        # 검증 오류 메시지·CHANGELOG 섹션 제목용 문자열 미리 계산
+        self._allowed_types_csv = ', '.join(self.allowed_types.keys())
+        self._type_titles = {k: v.title() for k, v in self.allowed_types.items()}
     
     def parse_commit_message(self, commit_msg: str) -> Optional[ConventionalCommit]:
         """커밋 메시지를 Conventional Commit 형식으로 파싱"""
@@ -85,17 +172,15 @@ class ConventionalCommitsManager:
         
         # 첫 번째 라인 파싱 (헤더)
         header = lines[0]
-        header_match = re.match(r'^(\w+)(?:\(([^)]+)\))?(!)?:\s*(.+)$', header)
+        header_match = _HEADER_RE.match(header)
         
         if not header_match:
             return None
         
         commit_type, scope, breaking_marker, description = header_match.groups()
         
-        # Breaking Change 확인
-        breaking_change = breaking_marker == '!' or any(
-            keyword in commit_msg for keyword in self.breaking_keywords
-        )
+        # Breaking Change 확인 ('!' 마커는 헤더에서, 키워드는 본문 줄 머리에서)
+        breaking_change = breaking_marker == '!'
         
         # 본문과 푸터 분리
         body_lines = []
@@ -103,9 +188,11 @@ class ConventionalCommitsManager:
         
         if len(lines) > 1:
             in_footer = False
+            breaking_keywords = self.breaking_keywords
             for line in lines[1:]:
-                if line.startswith('BREAKING CHANGE') or line.startswith('BREAKING:'):
+                if line.startswith(breaking_keywords):
                     in_footer = True
+                    breaking_change = True
                     footer_lines.append(line)
                 elif in_footer:
                     footer_lines.append(line)
@@ -118,8 +205,8 @@ class ConventionalCommitsManager:
             type=commit_type,
             scope=scope,
             description=description,
-            body='\n'.join(body_lines) if body_lines else None,
-            footer='\n'.join(footer_lines) if footer_lines else None,
+            body=_join_lines(body_lines),
+            footer=_join_lines(footer_lines),
             breaking_change=breaking_change,
             hash='',  # Git에서 가져올 예정
             date='',  # Git에서 가져올 예정
@@ -141,7 +228,7 @@ class ConventionalCommitsManager:
         
         # 타입 검증
         if commit.type not in self.allowed_types:
-            errors.append(f"알 수 없는 타입: {commit.type}. 허용된 타입: {', '.join(self.allowed_types.keys())}")
+            errors.append(f"알 수 없는 타입: {commit.type}. 허용된 타입: {self._allowed_types_csv}")
         
         # 설명 길이 검증
         if len(commit.description) < 10:
@@ -159,29 +246,28 @@ class ConventionalCommitsManager:
     def get_git_commits(self, since: Optional[str] = None, until: Optional[str] = None) -> List[ConventionalCommit]:
         """Git 커밋 히스토리 가져오기"""
         try:
-            # Git 커밋 목록 가져오기
-            cmd = ['git', 'log', '--pretty=format:%H|%ad|%an|%s|%b', '--date=iso']
+            # Git 커밋 목록 가져오기 (커밋은 NUL, 필드는 US(0x1f)로 구분 - 본문의 '|'·개행에 안전)
+            cmd = ['git', 'log', '-z', '--pretty=format:%H%x1f%ad%x1f%an%x1f%B', '--date=iso']
             
             if since:
                 cmd.extend(['--since', since])
             if until:
                 cmd.extend(['--until', until])
             
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             commits = []
             
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                
-                parts = line.split('|', 4)
-                if len(parts) >= 4:
-                    hash_val, date, author, subject, body = parts[0], parts[1], parts[2], parts[3], parts[4] if len(parts) > 4 else ''
+            # git이 출력하는 동안 레코드 단위로 바로 파싱 (전체 로그를 메모리에 모으지 않음)
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                  text=True, bufsize=GIT_LOG_CHUNK_SIZE) as proc:
+                for record in _iter_nul_records(proc.stdout):
+                    if not record:
+                        continue
                     
-                    # 커밋 메시지 재구성
-                    commit_msg = subject
-                    if body:
-                        commit_msg += '\n\n' + body
+                    hash_val, _, rest = record.partition('\x1f')
+                    date, _, rest = rest.partition('\x1f')
+                    author, sep, commit_msg = rest.partition('\x1f')
+                    if not sep:
+                        continue  # 필드가 모자란 레코드
                     
                     commit = self.parse_commit_message(commit_msg)
                     if commit:
@@ -189,6 +275,8 @@ class ConventionalCommitsManager:
                         commit.date = date
                         commit.author = author
                         commits.append(commit)
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
             
             return commits
             
@@ -198,126 +286,137 @@ class ConventionalCommitsManager:
     
     def analyze_commits(self, commits: List[ConventionalCommit]) -> Dict:
         """커밋 분석"""
-        analysis = {
-            'total_commits': len(commits),
-            'by_type': {},
-            'by_scope': {},
-            'breaking_changes': [],
-            'version_bump': 'patch',
-            'importance_score': 0
-        }
+        analysis, _ = self._scan(commits)
+        return analysis
+    
+    def _scan(self, commits: List[ConventionalCommit]) -> Tuple[Dict, Dict[str, List[ConventionalCommit]]]:
+        """커밋 목록 1회 순회로 분석 결과와 타입별 그룹(Breaking Change 제외)을 함께 계산"""
+        by_type: Dict[str, int] = {}
+        by_scope: Dict[str, int] = {}
+        breaking_changes: List[ConventionalCommit] = []
+        buckets: Dict[str, List[ConventionalCommit]] = defaultdict(list)
+        importance_levels = self.importance_levels
+        importance_score = 0
         
-        # 타입별 통계
         for commit in commits:
+            # 타입별 통계
             commit_type = commit.type
-            if commit_type not in analysis['by_type']:
-                analysis['by_type'][commit_type] = 0
-            analysis['by_type'][commit_type] += 1
+            by_type[commit_type] = by_type.get(commit_type, 0) + 1
             
             # 스코프별 통계
             if commit.scope:
-                if commit.scope not in analysis['by_scope']:
-                    analysis['by_scope'][commit.scope] = 0
-                analysis['by_scope'][commit.scope] += 1
+                by_scope[commit.scope] = by_scope.get(commit.scope, 0) + 1
             
-            # Breaking Change 수집
+            # Breaking Change 수집 / 타입별 그룹화
             if commit.breaking_change:
-                analysis['breaking_changes'].append(commit)
+                breaking_changes.append(commit)
+            else:
+                buckets[commit_type].append(commit)
             
             # 중요도 점수 계산
-            importance = self.importance_levels.get(commit_type, 1)
-            analysis['importance_score'] += importance
+            importance_score += importance_levels.get(commit_type, 1)
         
         # 버전 증가 결정
-        if analysis['breaking_changes']:
-            analysis['version_bump'] = 'major'
-        elif 'feat' in analysis['by_type']:
-            analysis['version_bump'] = 'minor'
+        if breaking_changes:
+            version_bump = 'major'
+        elif 'feat' in by_type:
+            version_bump = 'minor'
+        else:
+            version_bump = 'patch'
         
-        return analysis
+        analysis = {
+            'total_commits': len(commits),
+            'by_type': by_type,
+            'by_scope': by_scope,
+            'breaking_changes': breaking_changes,
+            'version_bump': version_bump,
+            'importance_score': importance_score
+        }
+        return analysis, buckets
     
     def generate_changelog(self, commits: List[ConventionalCommit], version: Optional[str] = None) -> str:
         """CHANGELOG 생성"""
         if not commits:
             return "# CHANGELOG\n\n변경사항이 없습니다.\n"
         
-        # 분석 수행
-        analysis = self.analyze_commits(commits)
+        # 분석 및 타입별 그룹화 (커밋 목록 1회 순회)
+        analysis, buckets = self._scan(commits)
         
         # 헤더 생성
-        changelog = f"# CHANGELOG\n\n"
+        parts = ["# CHANGELOG\n\n"]
         
         if version:
-            changelog += f"## [{version}] - {datetime.now().strftime('%Y-%m-%d')}\n\n"
+            parts.append(f"## [{version}] - {_today()}\n\n")
         
         # Breaking Changes
         if analysis['breaking_changes']:
-            changelog += "### ⚠️ BREAKING CHANGES\n\n"
+            parts.append("### ⚠️ BREAKING CHANGES\n\n")
             for commit in analysis['breaking_changes']:
-                changelog += f"- **{commit.type}**: {commit.description}\n"
+                parts.append(f"- **{commit.type}**: {commit.description}\n")
                 if commit.footer:
-                    changelog += f"  - {commit.footer.replace('BREAKING CHANGE:', '').strip()}\n"
-            changelog += "\n"
+                    parts.append(f"  - {commit.footer.replace('BREAKING CHANGE:', '').strip()}\n")
+            parts.append("\n")
         
         # 타입별 그룹화
         for commit_type in ['feat', 'fix', 'perf', 'refactor', 'docs', 'style', 'test', 'build', 'ci', 'chore']:
-            type_commits = [c for c in commits if c.type == commit_type and not c.breaking_change]
+            type_commits = buckets.get(commit_type)
             
             if type_commits:
-                type_name = self.allowed_types.get(commit_type, commit_type)
-                changelog += f"### {type_name.title()}\n\n"
+                type_title = self._type_titles.get(commit_type) or commit_type.title()
+                parts.append(f"### {type_title}\n\n")
                 
                 for commit in type_commits:
                     scope_text = f"**{commit.scope}**: " if commit.scope else ""
-                    changelog += f"- {scope_text}{commit.description}\n"
+                    parts.append(f"- {scope_text}{commit.description}\n")
                 
-                changelog += "\n"
+                parts.append("\n")
         
         # 통계 정보
-        changelog += "## 📊 통계\n\n"
-        changelog += f"- **총 커밋 수**: {analysis['total_commits']}개\n"
-        changelog += f"- **버전 증가**: {analysis['version_bump']}\n"
-        changelog += f"- **중요도 점수**: {analysis['importance_score']}\n"
+        parts.append("## 📊 통계\n\n")
+        parts.append(f"- **총 커밋 수**: {analysis['total_commits']}개\n")
+        parts.append(f"- **버전 증가**: {analysis['version_bump']}\n")
+        parts.append(f"- **중요도 점수**: {analysis['importance_score']}\n")
         
         if analysis['by_type']:
-            changelog += f"- **타입별 분포**: {', '.join([f'{k}({v})' for k, v in analysis['by_type'].items()])}\n"
+            parts.append(f"- **타입별 분포**: {', '.join([f'{k}({v})' for k, v in analysis['by_type'].items()])}\n")
         
-        return changelog
+        return ''.join(parts)
     
     def get_current_version(self) -> Optional[str]:
-        """현재 버전 가져오기"""
+        """현재 버전 가져오기 (매니저 인스턴스당 1회 조회)"""
+        if self._cached_version is None:
+            self._cached_version = self._read_current_version()
+        return self._cached_version
+    
+    def _read_current_version(self) -> Optional[str]:
+        """버전 파일/Git 태그에서 현재 버전 조회"""
         try:
             # package.json에서 버전 확인
-            if os.path.exists('package.json'):
-                with open('package.json', 'r') as f:
-                    data = json.load(f)
-                    return data.get('version')
-            
-            # pyproject.toml에서 버전 확인
-            if os.path.exists('pyproject.toml'):
-                with open('pyproject.toml', 'r') as f:
-                    content = f.read()
-                    version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                    if version_match:
-                        return version_match.group(1)
+            try:
+                data = json.loads(Path('package.json').read_bytes())
+            except FileNotFoundError:
+                pass
+            else:
+                return data.get('version')
             
-            # setup.py에서 버전 확인
-            if os.path.exists('setup.py'):
-                with open('setup.py', 'r') as f:
-                    content = f.read()
-                    version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                    if version_match:
-                        return version_match.group(1)
+            # pyproject.toml, setup.py에서 버전 확인
+            for version_file in ('pyproject.toml', 'setup.py'):
+                try:
+                    content = Path(version_file).read_bytes()
+                except FileNotFoundError:
+                    continue
+                version_match = _VERSION_TOML_RE_B.search(content)
+                if version_match:
+                    return version_match.group(1).decode('utf-8', 'replace')
             
-            # Git 태그에서 최신 버전 확인
-            result = subprocess.run(['git', 'tag', '--sort=-version:refname'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                tags = result.stdout.strip().split('\n')
-                # 버전 태그만 필터링
-                version_tags = [tag for tag in tags if re.match(r'^v?\d+\.\d+\.\d+', tag)]
-                if version_tags:
-                    return version_tags[0].lstrip('v')
+            # Git 태그에서 최신 버전 확인 (정렬·필터링은 git이 수행, 1개만 반환)
+            result = subprocess.run(['git', 'for-each-ref', '--sort=-v:refname', '--count=1',
+                                     '--format=%(refname:short)',
+                                     'refs/tags/v[0-9]*.[0-9]*.[0-9]*', 'refs/tags/[0-9]*.[0-9]*.[0-9]*'],
+                                    capture_output=True, text=True)
+            tag = result.stdout.strip()
+            if result.returncode == 0 and _SEMVER_TAG_RE.match(tag):
+                return tag.lstrip('v')
             
             return "0.1.0"  # 기본 버전
             
@@ -351,17 +450,31 @@ class ConventionalCommitsManager:
     
     def create_git_tag(self, version: str, message: Optional[str] = None) -> bool:
         """Git 태그 생성"""
+        return self.create_git_tags([(version, message)])
+    
+    def create_git_tags(self, releases: List[Tuple[str, Optional[str]]]) -> bool:
+        """여러 버전의 Git 태그를 로컬에서 만든 뒤 한 번의 push로 전송"""
+        tag_names = [f"v{version}" for version, _ in releases]
+        
+        # 기존 태그 확인 (git 프로세스 1개로 일괄 조회, 일부만 생성되는 상황 방지)
+        with _GitSession() as git:
+            existing = [tag_name for tag_name in tag_names if git.object_type(f"refs/tags/{tag_name}")]
+        if existing:
+            print(f"❌ Git 태그 생성 실패: 이미 존재하는 태그 {', '.join(existing)}")
+            return False
+        
         try:
-            tag_name = f"v{version}"
-            tag_message = message or f"Release version {version}"
-            
-            # 태그 생성
-            subprocess.run(['git', 'tag', '-a', tag_name, '-m', tag_message], check=True)
+            # 태그 생성 (로컬)
+            for tag_name, (version, message) in zip(tag_names, releases):
+                tag_message = message or f"Release version {version}"
+                subprocess.check_call(['git', 'tag', '-a', tag_name, '-m', tag_message])
             
-            # 태그 푸시
-            subprocess.run(['git', 'push', 'origin', tag_name], check=True)
+            # 태그 푸시 (1회)
+            if tag_names:
+                subprocess.check_call(['git', 'push', 'origin', *tag_names])
             
-            print(f"✅ Git 태그 생성 완료: {tag_name}")
+            for tag_name in tag_names:
+                print(f"✅ Git 태그 생성 완료: {tag_name}")
             return True
             
         except subprocess.CalledProcessError as e:
@@ -369,7 +482,14 @@ class ConventionalCommitsManager:
             return False
     
     def create_github_release(self, version: str, changelog: str, draft: bool = False) -> bool:
-        """GitHub 릴리즈 생성 (GitHub CLI 사용)"""
+        """GitHub 릴리즈 생성 (GITHUB_TOKEN이 있으면 REST API, 없으면 GitHub CLI 사용)"""
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            repository = self._github_repository()
+            if repository:
+                return self._create_github_release_api(token, repository, version, changelog, draft)
+            print("⚠️ GitHub 저장소를 확인할 수 없어 GitHub CLI로 진행합니다.")
+        
         try:
             # GitHub CLI 설치 확인
             result = subprocess.run(['gh', '--version'], capture_output=True, text=True)
@@ -380,20 +500,12 @@ class ConventionalCommitsManager:
             tag_name = f"v{version}"
             release_title = f"Release {version}"
             
-            # 임시 파일에 CHANGELOG 저장
-            temp_file = f"CHANGELOG_{version}.md"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(changelog)
-            
-            # GitHub 릴리즈 생성
-            cmd = ['gh', 'release', 'create', tag_name, '--title', release_title, '--notes-file', temp_file]
+            # GitHub 릴리즈 생성 (CHANGELOG는 표준 입력으로 전달 - 임시 파일 없음)
+            cmd = ['gh', 'release', 'create', tag_name, '--title', release_title, '--notes-file', '-']
             if draft:
                 cmd.append('--draft')
             
-            subprocess.run(cmd, check=True)
-            
-            # 임시 파일 삭제
-            os.remove(temp_file)
+            subprocess.run(cmd, input=changelog, encoding='utf-8', check=True)
             
             print(f"✅ GitHub 릴리즈 생성 완료: {tag_name}")
             return True
@@ -401,6 +513,50 @@ class ConventionalCommitsManager:
         except subprocess.CalledProcessError as e:
             print(f"❌ GitHub 릴리즈 생성 실패: {e}")
             return False
+    
+    def _github_repository(self) -> Optional[str]:
+        """owner/repo 형식의 GitHub 저장소 이름 (GITHUB_REPOSITORY 또는 origin 원격)"""
+        repository = os.environ.get('GITHUB_REPOSITORY')
+        if repository:
+            return repository
+        
+        result = subprocess.run(['git', 'remote', 'get-url', 'origin'], capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        remote_match = _GITHUB_REMOTE_RE.search(result.stdout.strip())
+        return remote_match.group(1) if remote_match else None
+    
+    def _create_github_release_api(self, token: str, repository: str, version: str,
+                                   changelog: str, draft: bool) -> bool:
+        """GitHub REST API로 릴리즈 생성 (CHANGELOG를 요청 본문에 직접 전달)"""
+        tag_name = f"v{version}"
+        payload = {
+            'tag_name': tag_name,
+            'name': f"Release {version}",
+            'body': changelog,
+            'draft': draft
+        }
+        req = urllib.request.Request(
+            f"{GITHUB_API_URL}/repos/{repository}/releases",
+            data=json.dumps(payload).encode('utf-8'),
+            headers={
+                'Authorization': f"Bearer {token}",
+                'Accept': 'application/vnd.github+json',
+                'Content-Type': 'application/json',
+                'X-GitHub-Api-Version': '2022-11-28'
+            },
+            method='POST'
+        )
+        
+        try:
+            with urllib.request.urlopen(req, timeout=GITHUB_API_TIMEOUT) as response:
+                response.read()
+        except OSError as e:  # HTTPError·URLError·타임아웃 포함
+            print(f"❌ GitHub 릴리즈 생성 실패: {e}")
+            return False
+        
+        print(f"✅ GitHub 릴리즈 생성 완료: {tag_name}")
+        return True
 
 def main():
     """메인 함수"""
@@ -15,11 +15,19 @@ import json
 import argparse
 import sys
 import os
+import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
 # Graphviz imports
 try:
     from graphviz import Digraph
@@ -32,7 +40,10 @@ except ImportError:
 
 # Mermaid은 텍스트 기반이므로 별도 라이브러리 불필요
 
-@dataclass
+# 태스크 수가 많을 때 인스턴스별 __dict__ 제거 (slots 인자는 Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class TaskNode:
     """태스크 노드 정보"""
     id: str
@@ -43,6 +54,11 @@ class TaskNode:
     deps: List[str]
     order: Optional[int] = None
     status: str = "pending"  # pending, in_progress, completed
+    safe_id: str = field(default="", repr=False, compare=False)  # Mermaid용 ID (':' → '_')
+    
+    def __post_init__(self):
+        if not self.safe_id:
+            self.safe_id = self.id.replace(':', '_')
 
 class DAGVisualizer:
     """DAG 시각화 도구"""
@@ -52,7 +68,15 @@ class DAGVisualizer:
         self.tasks: Dict[str, TaskNode] = {}
         self.task_list: List[TaskNode] = []
         self.dependency_graph: Dict[str, Set[str]] = {}
-        self.reverse_deps: Dict[str, Set[str]] = {}
+        self.reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+        
+        # 의존성 그래프 구성 시 1회 계산하는 파생 값
+        self._critical_path: List[str] = []
+        self._critical_ids: frozenset = frozenset()
+        self._complexity_bins: Tuple[int, int, int, int] = (0, 0, 0, 0)  # Gantt 구간 (≤1, ≤2, ≤3, >3)
+        self._complexity_distribution: Tuple[int, int, int, int] = (0, 0, 0, 0)  # 요약 구간 [0,1) [1,2) [2,3) [3,∞)
+        self._complexity_total = 0.0
+        self._edges: List[Tuple[TaskNode, TaskNode, bool]] = []  # (의존 대상, 태스크, 임계 여부)
         
         # 시각화 설정
         self.colors = {
@@ -76,8 +100,9 @@ class DAGVisualizer:
     def load_tasks(self):
         """태스크 데이터 로드"""
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.input_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # 태스크 파싱
             for task_data in data.get('tasks', []):
@@ -109,13 +134,61 @@ class DAGVisualizer:
             self.dependency_graph[task.id] = set(task.deps)
             
             # 역방향 의존성 구성
-            if task.id not in self.reverse_deps:
-                self.reverse_deps[task.id] = set()
-            
             for dep in task.deps:
-                if dep not in self.reverse_deps:
-                    self.reverse_deps[dep] = set()
                 self.reverse_deps[dep].add(task.id)
+        
+        self._summarize_complexity()
+        
+        # 렌더링용 엣지 목록 (목록 밖 의존성 제외, 임계 여부 미리 계산)
+        tasks = self.tasks
+        crit_ids = self._critical_ids
+        edges = []
+        for task in self.task_list:
+            task_critical = task.id in crit_ids
+            for dep in task.deps:
+                dep_task = tasks.get(dep)
+                if dep_task is not None:
+                    edges.append((dep_task, task, task_critical or dep in crit_ids))
+        self._edges = edges
+    
+    def _summarize_complexity(self):
+        """임계 태스크와 복잡도 구간별 개수를 태스크 목록 1회 순회로 계산"""
+        critical_path = []
+        low = medium = high = critical = 0
+        dist = [0, 0, 0, 0]
+        total = 0.0
+        
+        for task in self.task_list:
+            c = task.complexity
+            total += c
+            if c >= 2.0:
+                critical_path.append(task.id)
+            
+            # Gantt 구간 (상한 포함)
+            if c <= 1.0:
+                low += 1
+            elif c <= 2.0:
+                medium += 1
+            elif c <= 3.0:
+                high += 1
+            else:
+                critical += 1
+            
+            # 요약 리포트 구간 (하한 포함, 음수 제외)
+            if c >= 3.0:
+                dist[3] += 1
+            elif c >= 2.0:
+                dist[2] += 1
+            elif c >= 1.0:
+                dist[1] += 1
+            elif c >= 0.0:
+                dist[0] += 1
+        
+        self._critical_path = critical_path
+        self._critical_ids = frozenset(critical_path)
+        self._complexity_bins = (low, medium, high, critical)
+        self._complexity_distribution = tuple(dist)
+        self._complexity_total = total
     
     def _get_complexity_color(self, complexity: float) -> str:
         """복잡도에 따른 색상 반환"""
@@ -132,7 +205,7 @@ class DAGVisualizer:
         """태스크 타입에 따른 색상 반환"""
         return self.colors.get(task_type, self.colors['default'])
     
-    def generate_graphviz_dag(self, output_file: str = "tasks_dag"):
+    def generate_graphviz_dag(self, output_file: str = "tasks_dag", png: bool = True):
         """Graphviz DAG 생성"""
         if not GRAPHVIZ_AVAILABLE:
             print("❌ Graphviz가 설치되지 않음. pip install graphviz 실행 필요")
@@ -167,25 +240,25 @@ class DAGVisualizer:
                 )
             
             # 엣지 생성 (의존성)
-            for task in self.task_list:
-                for dep in task.deps:
-                    if dep in self.tasks:
-                        # 임계 경로 강조 (높은 복잡도 태스크들)
-                        if task.complexity >= 2.0 or self.tasks[dep].complexity >= 2.0:
-                            dot.edge(dep, task.id, color='red', penwidth='2')
-                        else:
-                            dot.edge(dep, task.id, color='gray')
+            for dep_task, task, critical in self._edges:
+                # 임계 경로 강조 (높은 복잡도 태스크들)
+                if critical:
+                    dot.edge(dep_task.id, task.id, color='red', penwidth='2')
+                else:
+                    dot.edge(dep_task.id, task.id, color='gray')
             
             # 레이아웃 최적화
             self._optimize_graphviz_layout(dot)
             
-            # 파일 출력
-            dot.render(output_file, format='svg', cleanup=True)
-            dot.render(output_file, format='png', cleanup=True)
+            # 파일 출력 (dot 1회 실행으로 모든 형식 렌더링)
+            formats = ['svg', 'png'] if png else ['svg']
+            if self._render_dot(dot.source, output_file, formats):
+                print("ℹ️ DAG 변경 없음 - 기존 렌더링 재사용")
             
             print(f"✅ Graphviz DAG 생성 완료:")
             print(f"  • SVG: {output_file}.svg")
-            print(f"  • PNG: {output_file}.png")
+            if png:
+                print(f"  • PNG: {output_file}.png")
             
             return True
             
@@ -193,6 +266,26 @@ class DAGVisualizer:
             print(f"❌ Graphviz DAG 생성 실패: {e}")
             return False
     
+    def _render_dot(self, source: str, output_file: str, formats: List[str]) -> bool:
+        """DOT 소스를 저장하고 dot 1회 호출로 렌더링 (소스·결과물이 그대로면 생략하고 True 반환)"""
+        dot_path = Path(f"{output_file}.dot")
+        outputs = [Path(f"{output_file}.{fmt}") for fmt in formats]
+        
+        try:
+            unchanged = dot_path.read_text(encoding='utf-8') == source
+        except OSError:
+            unchanged = False
+        if unchanged and all(path.exists() for path in outputs):
+            return True
+        
+        dot_path.write_text(source, encoding='utf-8')
+        cmd = ['dot']
+        for fmt, path in zip(formats, outputs):
+            cmd += [f'-T{fmt}', '-o', str(path)]  # -T마다 뒤따르는 -o가 출력 파일 지정
+        cmd.append(str(dot_path))
+        subprocess.run(cmd, check=True, capture_output=True)
+        return False
+    
     def _optimize_graphviz_layout(self, dot: Digraph):
         """Graphviz 레이아웃 최적화"""
         # 임계 경로 식별 및 강조
@@ -207,12 +300,9 @@ class DAGVisualizer:
                         c.node(task_id)
         
         # 모듈별 그룹화
-        modules = {}
+        modules = defaultdict(list)
         for task in self.task_list:
-            module = task.module
-            if module not in modules:
-                modules[module] = []
-            modules[module].append(task.id)
+            modules[task.module].append(task.id)
         
         for module, task_ids in modules.items():
             if len(task_ids) > 1:
@@ -223,14 +313,8 @@ class DAGVisualizer:
     
     def _find_critical_path(self) -> List[str]:
         """임계 경로 찾기 (최장 경로)"""
-        # 간단한 임계 경로 알고리즘 (복잡도 기반)
-        critical_tasks = []
-        
-        for task in self.task_list:
-            if task.complexity >= 2.0:
-                critical_tasks.append(task.id)
-        
-        return critical_tasks
+        # 간단한 임계 경로 알고리즘 (복잡도 기반, 그래프 구성 시 계산됨)
+        return list(self._critical_path)
     
     def generate_mermaid_gantt(self, output_file: str = "tasks_gantt.md"):
         """Mermaid Gantt 차트 생성"""
@@ -241,7 +325,7 @@ class DAGVisualizer:
             start_date = datetime.now()
             
             # Mermaid Gantt 템플릿
-            gantt_content = f"""# 태스크 실행 계획 (Gantt Chart)
+            parts = [f"""# 태스크 실행 계획 (Gantt Chart)
 
 ```mermaid
 gantt
@@ -250,24 +334,20 @@ gantt
     axisFormat  %m/%d
     
     section Core Setup
-"""
+"""]
             
             # 태스크별 섹션 구성
             current_date = start_date
-            sections = {}
+            sections = defaultdict(list)
             
             for task in self.task_list:
-                module = task.module
-                if module not in sections:
-                    sections[module] = []
-                
                 # 예상 소요 시간 계산 (복잡도 기반)
                 duration_days = max(1, int(task.complexity))
                 
                 # 날짜 계산
                 end_date = current_date + timedelta(days=duration_days)
                 
-                sections[module].append({
+                sections[task.module].append({
                     'task': task,
                     'start': current_date,
                     'end': end_date,
@@ -278,7 +358,7 @@ gantt
             
             # 섹션별 출력
             for module, tasks in sections.items():
-                gantt_content += f"\n    section {module.title()}\n"
+                parts.append(f"\n    section {module.title()}\n")
                 
                 for task_info in tasks:
                     task = task_info['task']
@@ -291,9 +371,9 @@ gantt
                     # 라벨 구성
                     label = f"{task.id}: {task.title[:20]}{'...' if len(task.title) > 20 else ''}"
                     
-                    gantt_content += f"    {label}     :{status}, {task.id.replace(':', '_')}, {start_str}, {duration}d\n"
+                    parts.append(f"    {label}     :{status}, {task.safe_id}, {start_str}, {duration}d\n")
             
-            gantt_content += """```
+            parts.append("""```
 
 ## 복잡도 분석
 
@@ -311,35 +391,33 @@ gantt
 ## 의존성 분석
 
 {dependency_section}
-"""
+""")
             
-            # 복잡도 통계 계산
-            low_count = sum(1 for t in self.task_list if t.complexity <= 1.0)
-            medium_count = sum(1 for t in self.task_list if 1.0 < t.complexity <= 2.0)
-            high_count = sum(1 for t in self.task_list if 2.0 < t.complexity <= 3.0)
-            critical_count = sum(1 for t in self.task_list if t.complexity > 3.0)
+            # 복잡도 통계 (그래프 구성 시 계산됨)
+            low_count, medium_count, high_count, critical_count = self._complexity_bins
             
             # 임계 경로 섹션
             critical_path = self._find_critical_path()
-            critical_path_section = ""
             if critical_path:
-                critical_path_section = "다음 태스크들이 임계 경로를 구성합니다:\n\n"
+                critical_lines = ["다음 태스크들이 임계 경로를 구성합니다:\n\n"]
                 for task_id in critical_path:
                     if task_id in self.tasks:
                         task = self.tasks[task_id]
-                        critical_path_section += f"- **{task.id}**: {task.title} (복잡도: {task.complexity:.2f})\n"
+                        critical_lines.append(f"- **{task.id}**: {task.title} (복잡도: {task.complexity:.2f})\n")
+                critical_path_section = "".join(critical_lines)
             else:
                 critical_path_section = "현재 임계 경로가 식별되지 않았습니다."
             
             # 의존성 섹션
-            dependency_section = "### 의존성 체인\n\n"
+            dependency_lines = ["### 의존성 체인\n\n"]
             for task in self.task_list:
                 if task.deps:
                     deps_str = ", ".join(task.deps)
-                    dependency_section += f"- **{task.id}** → {deps_str}\n"
+                    dependency_lines.append(f"- **{task.id}** → {deps_str}\n")
+            dependency_section = "".join(dependency_lines)
             
             # 통계 값 치환
-            gantt_content = gantt_content.format(
+            gantt_content = "".join(parts).format(
                 low_count=low_count,
                 medium_count=medium_count,
                 high_count=high_count,
@@ -349,8 +427,7 @@ gantt
             )
             
             # 파일 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(gantt_content)
+            Path(output_file).write_bytes(gantt_content.encode('utf-8'))
             
             print(f"✅ Mermaid Gantt 차트 생성 완료: {output_file}")
             return True
@@ -364,11 +441,11 @@ gantt
         print("🔄 Mermaid Flowchart 생성 중...")
         
         try:
-            flowchart_content = """# 태스크 실행 플로우
+            parts = ["""# 태스크 실행 플로우
 
 ```mermaid
 flowchart TD
-"""
+"""]
             
             # 노드 정의
             for task in self.task_list:
@@ -383,23 +460,18 @@ flowchart TD
                 # 노드 라벨
                 label = f"{task.id}\\n{task.title[:25]}{'...' if len(task.title) > 25 else ''}\\nC={task.complexity:.1f}"
                 
-                flowchart_content += f'    {task.id.replace(":", "_")}["{label}"]\n'
+                parts.append(f'    {task.safe_id}["{label}"]\n')
             
             # 엣지 정의 (의존성)
-            flowchart_content += "\n"
-            for task in self.task_list:
-                for dep in task.deps:
-                    if dep in self.tasks:
-                        dep_node = dep.replace(":", "_")
-                        task_node = task.id.replace(":", "_")
-                        
-                        # 임계 경로 강조
-                        if task.complexity >= 2.0 or self.tasks[dep].complexity >= 2.0:
-                            flowchart_content += f"    {dep_node} -->|critical| {task_node}\n"
-                        else:
-                            flowchart_content += f"    {dep_node} --> {task_node}\n"
-            
-            flowchart_content += """```
+            parts.append("\n")
+            for dep_task, task, critical in self._edges:
+                # 임계 경로 강조
+                if critical:
+                    parts.append(f"    {dep_task.safe_id} -->|critical| {task.safe_id}\n")
+                else:
+                    parts.append(f"    {dep_task.safe_id} --> {task.safe_id}\n")
+            
+            parts.append("""```
 
 ## 레전드
 
@@ -411,20 +483,19 @@ flowchart TD
 ## 실행 순서
 
 {execution_order}
-"""
+""")
             
             # 실행 순서 생성 (토폴로지 순서)
-            execution_order = ""
             sorted_tasks = sorted(self.task_list, key=lambda x: x.order or 0)
+            execution_order = "".join(
+                f"{i}. **{task.id}**: {task.title} (복잡도: {task.complexity:.2f})\n"
+                for i, task in enumerate(sorted_tasks, 1)
+            )
             
-            for i, task in enumerate(sorted_tasks, 1):
-                execution_order += f"{i}. **{task.id}**: {task.title} (복잡도: {task.complexity:.2f})\n"
-            
-            flowchart_content = flowchart_content.format(execution_order=execution_order)
+            flowchart_content = "".join(parts).format(execution_order=execution_order)
             
             # 파일 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(flowchart_content)
+            Path(output_file).write_bytes(flowchart_content.encode('utf-8'))
             
             print(f"✅ Mermaid Flowchart 생성 완료: {output_file}")
             return True
@@ -440,46 +511,41 @@ flowchart TD
         try:
             # 먼저 변수들을 계산
             # 복잡도 분포
-            complexity_distribution = ""
-            complexity_ranges = [
-                (0.0, 1.0, "🟢 낮음"),
-                (1.0, 2.0, "🟡 중간"),
-                (2.0, 3.0, "🔴 높음"),
-                (3.0, float('inf'), "🟣 매우 높음")
-            ]
-            
-            for min_comp, max_comp, label in complexity_ranges:
-                count = sum(1 for t in self.task_list if min_comp <= t.complexity < max_comp)
+            complexity_lines = []
+            complexity_labels = ["🟢 낮음", "🟡 중간", "🔴 높음", "🟣 매우 높음"]
+            
+            for label, count in zip(complexity_labels, self._complexity_distribution):
                 percentage = (count / len(self.task_list)) * 100 if self.task_list else 0
-                complexity_distribution += f"- {label}: {count}개 ({percentage:.1f}%)\n"
+                complexity_lines.append(f"- {label}: {count}개 ({percentage:.1f}%)\n")
+            complexity_distribution = "".join(complexity_lines)
             
             # 모듈별 분포
-            module_distribution = ""
-            modules = {}
+            modules = defaultdict(lambda: {'count': 0, 'total_complexity': 0})
             for task in self.task_list:
-                module = task.module
-                if module not in modules:
-                    modules[module] = {'count': 0, 'total_complexity': 0}
-                modules[module]['count'] += 1
-                modules[module]['total_complexity'] += task.complexity
+                stats = modules[task.module]
+                stats['count'] += 1
+                stats['total_complexity'] += task.complexity
             
+            module_lines = []
             for module, stats in modules.items():
                 avg_complexity = stats['total_complexity'] / stats['count']
-                module_distribution += f"- **{module}**: {stats['count']}개 (평균 복잡도: {avg_complexity:.2f})\n"
+                module_lines.append(f"- **{module}**: {stats['count']}개 (평균 복잡도: {avg_complexity:.2f})\n")
+            module_distribution = "".join(module_lines)
             
             # 권장사항
-            recommendations = ""
-            high_complexity_tasks = [t for t in self.task_list if t.complexity >= 2.0]
+            recommendation_lines = []
+            high_complexity_tasks = self._critical_path
             if high_complexity_tasks:
-                recommendations += f"- **높은 복잡도 태스크 ({len(high_complexity_tasks)}개) 우선 처리**: "
-                recommendations += ", ".join([t.id for t in high_complexity_tasks]) + "\n"
+                recommendation_lines.append(f"- **높은 복잡도 태스크 ({len(high_complexity_tasks)}개) 우선 처리**: ")
+                recommendation_lines.append(", ".join(high_complexity_tasks) + "\n")
             
             independent_tasks = self._get_independent_tasks()
             if independent_tasks:
-                recommendations += f"- **독립 태스크 병렬 실행**: {', '.join(independent_tasks)}\n"
+                recommendation_lines.append(f"- **독립 태스크 병렬 실행**: {', '.join(independent_tasks)}\n")
             
-            recommendations += "- **의존성 체인 최적화**: 병목 지점 식별 및 해결\n"
-            recommendations += "- **리소스 할당**: 복잡도 기반 시간 및 인력 계획"
+            recommendation_lines.append("- **의존성 체인 최적화**: 병목 지점 식별 및 해결\n")
+            recommendation_lines.append("- **리소스 할당**: 복잡도 기반 시간 및 인력 계획")
+            recommendations = "".join(recommendation_lines)
             
             # 이제 템플릿 생성
             report_content = f"""# DAG 시각화 요약 리포트
@@ -491,7 +557,7 @@ flowchart TD
 
 - **총 태스크 수**: {len(self.task_list)}개
 - **모듈 수**: {len(set(t.module for t in self.task_list))}개
-- **평균 복잡도**: {sum(t.complexity for t in self.task_list) / len(self.task_list):.2f}
+- **평균 복잡도**: {self._complexity_total / len(self.task_list):.2f}
 
 ### 복잡도 분포
 
@@ -528,8 +594,7 @@ flowchart TD
             
             
             # 파일 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            Path(output_file).write_bytes(report_content.encode('utf-8'))
             
             print(f"✅ 시각화 요약 리포트 생성 완료: {output_file}")
             return True
@@ -538,50 +603,63 @@ flowchart TD
             print(f"❌ 시각화 요약 리포트 생성 실패: {e}")
             return False
     
-    def _get_max_dependency_depth(self) -> int:
-        """최대 의존성 깊이 계산"""
-        def get_depth(task_id: str, visited: Set[str]) -> int:
-            if task_id in visited:
-                return 0  # 순환 참조 방지
-            
-            visited.add(task_id)
-            max_depth = 0
-            
-            for dep in self.dependency_graph.get(task_id, []):
-                depth = get_depth(dep, visited) + 1
-                max_depth = max(max_depth, depth)
-            
-            visited.remove(task_id)
-            return max_depth
+    def _topological_order(self) -> List[str]:
+        """Kahn 알고리즘으로 의존 대상이 먼저 오도록 정렬 (순환에 걸린 태스크는 제외)"""
+        graph = self.dependency_graph
+        indegree = {task_id: 0 for task_id in graph}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in graph}
+        for task_id, deps in graph.items():
+            for dep in deps:
+                if dep in dependents:  # 태스크 목록 밖의 의존성은 정렬 대상 아님
+                    dependents[dep].append(task_id)
+                    indegree[task_id] += 1
         
-        max_depth = 0
-        for task in self.task_list:
-            depth = get_depth(task.id, set())
-            max_depth = max(max_depth, depth)
+        order = [task_id for task_id, degree in indegree.items() if degree == 0]
+        head = 0
+        while head < len(order):
+            task_id = order[head]
+            head += 1
+            for dependent in dependents[task_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    order.append(dependent)
+        return order
+    
+    def _get_max_dependency_depth(self) -> int:
+        """최대 의존성 깊이 계산 (위상 순서 DP, 간선당 1회 방문)"""
+        depth: Dict[str, int] = {}
+        for task_id in self._topological_order():
+            deps = self.dependency_graph[task_id]
+            # 태스크 목록 밖의 의존성은 깊이 0의 말단으로 취급
+            depth[task_id] = 1 + max(depth.get(dep, 0) for dep in deps) if deps else 0
         
-        return max_depth
+        return max(depth.values(), default=0)
     
     def _detect_cycles(self) -> str:
-        """순환 의존성 감지"""
-        def has_cycle(task_id: str, visited: Set[str], rec_stack: Set[str]) -> bool:
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            for dep in self.dependency_graph.get(task_id, []):
-                if dep not in visited:
-                    if has_cycle(dep, visited, rec_stack):
-                        return True
-                elif dep in rec_stack:
-                    return True
-            
-            rec_stack.remove(task_id)
-            return False
+        """순환 의존성 감지 (반복형 3색 DFS, 첫 역방향 간선에서 종료)"""
+        WHITE, GRAY, BLACK = 0, 1, 2
+        graph = self.dependency_graph
+        color: Dict[str, int] = {}
         
-        visited = set()
         for task in self.task_list:
-            if task.id not in visited:
-                if has_cycle(task.id, visited, set()):
-                    return "발견됨 ⚠️"
+            if color.get(task.id, WHITE) != WHITE:
+                continue
+            
+            color[task.id] = GRAY
+            stack = [(task.id, iter(graph.get(task.id, ())))]
+            while stack:
+                node, deps = stack[-1]
+                for dep in deps:
+                    dep_color = color.get(dep, WHITE)
+                    if dep_color == GRAY:
+                        return "발견됨 ⚠️"
+                    if dep_color == WHITE:
+                        color[dep] = GRAY
+                        stack.append((dep, iter(graph.get(dep, ()))))
+                        break
+                else:
+                    color[node] = BLACK
+                    stack.pop()
         
         return "없음 ✅"
     
@@ -601,6 +679,7 @@ def main():
                        default='all', help='출력 형식')
     parser.add_argument('--output', '-o', help='출력 파일명 (확장자 제외)')
     parser.add_argument('--verbose', '-v', action='store_true', help='상세 출력')
+    parser.add_argument('--skip-png', action='store_true', help='Graphviz PNG 렌더링 생략 (SVG만 생성)')
     
     args = parser.parse_args()
     
@@ -612,27 +691,25 @@ def main():
     visualizer = DAGVisualizer(args.input)
     visualizer.load_tasks()
     
-    # 출력 형식에 따른 시각화 생성
-    success_count = 0
-    total_count = 0
+    # 출력 형식에 따른 생성 작업 수집 (캐시는 load_tasks에서 계산 완료, 생성기는 읽기 전용)
+    jobs = []
     
     if args.format in ['graphviz', 'both', 'all']:
-        total_count += 1
         output_file = args.output or "tasks_dag"
-        if visualizer.generate_graphviz_dag(output_file):
-            success_count += 1
+        jobs.append(lambda: visualizer.generate_graphviz_dag(output_file, png=not args.skip_png))
     
     if args.format in ['mermaid', 'both', 'all']:
-        total_count += 2
-        if visualizer.generate_mermaid_gantt():
-            success_count += 1
-        if visualizer.generate_mermaid_flowchart():
-            success_count += 1
+        jobs.append(visualizer.generate_mermaid_gantt)
+        jobs.append(visualizer.generate_mermaid_flowchart)
     
     if args.format == 'all':
-        total_count += 1
-        if visualizer.generate_summary_report():
-            success_count += 1
+        jobs.append(visualizer.generate_summary_report)
+    
+    # 독립적인 출력 파일을 병렬 생성 (dot 렌더링과 파일 쓰기 대기 시간 중첩)
+    total_count = len(jobs)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(job) for job in jobs]
+        success_count = sum(1 for future in futures if future.result())
     
     # 결과 출력
     print(f"\n🎉 시각화 완료: {success_count}/{total_count}개 파일 생성 성공")
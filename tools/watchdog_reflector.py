@@ -21,6 +21,11 @@ from typing import Dict, List, Set, Optional
 from dataclasses import dataclass, field
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml 기반 C 로더
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Watchdog imports
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileMovedEvent
@@ -36,6 +41,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_file_digest = getattr(hashlib, "file_digest", None)  # Python 3.11+
+
 @dataclass
 class WatchdogConfig:
     """Watchdog 설정"""
@@ -135,6 +142,8 @@ class AdvancedFileHandler(FileSystemEventHandler):
         """파일 해시 계산 (SHA-256)"""
         try:
             with open(file_path, 'rb') as f:
+                if _file_digest is not None:
+                    return _file_digest(f, "sha256").hexdigest()
                 return hashlib.sha256(f.read()).hexdigest()
         except Exception as e:
             logger.warning(f"해시 계산 오류 {file_path}: {e}")
@@ -316,7 +325,7 @@ def load_config(config_file: str) -> WatchdogConfig:
     """설정 파일 로드"""
     try:
         with open(config_file, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
         
         return WatchdogConfig(**config_data)
     except Exception as e: